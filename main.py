@@ -18,6 +18,8 @@ Orchestrates the Senses, Brain, Memory, Hands, and the Visual Cortex (HUD).
 
 import asyncio
 import signal
+import socket
+import string
 import sys
 import json
 from pathlib import Path
@@ -39,20 +41,59 @@ from src.core.exceptions import JarvisError
 
 # Import Singletons
 from src.senses import d_stt, d_tts
-from src.brain import d_brain
+from src.senses.tts import split_sentences
+from src.brain import get_brain
 from src.memory import d_hippocampus
-from src.tools import d_hands
+from src.tools.music import is_music_playing
 from src.senses.ears_v2 import NaturalEars
 from src.brain.reflex import d_spine
-import re
 
 # Import UI
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QThread, pyqtSignal, QObject, QSocketNotifier
 from src.ui.hud import JarvisHUD
 
 logger = get_logger(__name__)
 
+# Wake word variants (common Whisper mishearings of "Jarvis")
+# Matched as whole tokens so "harvest" doesn't fire inside "harvested"
+WAKE_WORD_VARIANTS = frozenset({
+    "jarvis", "darius", "jervis", "jarv", "jaravis", "jarvi",
+    "service", "harvest", "travis", "davis", "chavis",
+    "chief"
+})
+
+# Punctuation stripped from transcripts: ASCII punctuation plus the Unicode
+# General Punctuation block (curly quotes, dashes, ellipsis) Whisper emits
+_PUNCT_TABLE = str.maketrans(
+    "", "",
+    string.punctuation
+    + "".join(ch for ch in map(chr, range(0x2000, 0x2070)) if not ch.isspace())
+)
+
+# Strong refs to fire-and-forget tasks so they aren't garbage collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _log_background_error(task: asyncio.Task) -> None:
+    """Done-callback: drop the task ref and surface any failure."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background task failed: {task.exception()}")
+
+
+def run_in_background(coro) -> asyncio.Task:
+    """Schedule a fire-and-forget coroutine, keeping a ref until it finishes and logging failures."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_log_background_error)
+    return task
+
+
+def memorize_in_background(text: str, source: str) -> None:
+    """Store a memory off the event loop so the next turn isn't delayed by embedding/disk I/O."""
+    run_in_background(asyncio.to_thread(d_hippocampus.memorize, text, source))
+
 
 def print_banner() -> None:
     """Print the JARVIS startup banner."""
@@ -83,30 +124,93 @@ class JarvisWorker(QThread):
     state_signal = pyqtSignal(str) # "IDLE", "LISTENING", "PROCESSING", "SPEAKING"
     text_signal = pyqtSignal(str)  # Updates the text label
     
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._loop = None
+        self._main_task = None
+        self.speaker_task = None
+        
     def run(self):
         """Entry point for the thread."""
-        asyncio.run(self.agent_loop())
+        asyncio.run(self._run())
+        
+    async def _run(self):
+        """Run the agent loop until cancelled, then release resources."""
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        try:
+            await self.agent_loop()
+        except asyncio.CancelledError:
+            logger.info("Agent loop cancelled, shutting down.")
+        finally:
+            await self.shutdown()
+            
+    def request_stop(self):
+        """Thread-safe: cancel the agent loop from the GUI thread at its next await."""
+        if self._loop and self._main_task:
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
+            
+    async def shutdown(self):
+        """Stop speech and let in-flight background work finish."""
+        if self.speaker_task:
+            self.speaker_task.cancel()
+        d_tts.stop()
+        if _background_tasks:
+            await asyncio.wait(set(_background_tasks), timeout=2.0)
+        
+    async def speak_sentences(self, sentences: asyncio.Queue):
+        """
+        Speak queued sentences in order until a None sentinel arrives.
+        Tracks speaking state for the barge-in guard.
+        """
+        self.is_speaking = True
+        try:
+            if settings.use_thinking_filler:
+                # Mask slow brain turns: only speak the filler if the first
+                # sentence hasn't arrived within the delay
+                try:
+                    first = await asyncio.wait_for(
+                        sentences.get(), timeout=settings.thinking_filler_delay
+                    )
+                except asyncio.TimeoutError:
+                    await d_tts.speak(settings.thinking_filler_text)
+                    first = await sentences.get()
+                if first is None:
+                    return
+                await d_tts.speak(first)
+            
+            while (sentence := await sentences.get()) is not None:
+                await d_tts.speak(sentence)
+        finally:
+            self.is_speaking = False
         
     async def agent_loop(self):
         """
         Main orchestration loop:
-        Listen (Latch) -> VAD -> Transcribe -> Wake/Command -> Act -> Speak -> Keep Latch
+        Listen (Latch) -> VAD -> Stream Transcribe -> Wake/Command -> Act -> Speak -> Keep Latch
         """
+        # Warm up STT in the background so the first command skips model load
+        run_in_background(d_stt.warmup())
+        # Build the brain (provider SDKs, clients) off-thread; awaited on first command
+        brain_task = asyncio.create_task(get_brain())
+        # Load Moondream ahead of the first screen question
+        if settings.enable_vision:
+            from src.senses import vision
+            run_in_background(vision.warmup())
+        # Synthesize the filler up front so it replays from the TTS cache
+        if settings.use_thinking_filler:
+            run_in_background(d_tts.precache([settings.thinking_filler_text]))
+        
         jarvis_speak("Ready for your command, Sheriff.")
         self.state_signal.emit("IDLE")
         self.text_signal.emit("Online - Waiting for command")
         
         self.is_speaking = False
+        self.speaker_task = None
         
         # Initialize Ears
         ears = NaturalEars()
         
-        wake_word_variants = [
-            "jarvis", "darius", "jervis", "jarv", "jaravis", "jarvi", 
-            "service", "harvest", "travis", "davis", "chavis", 
-            "chief"
-        ]
-        
         while True:
             try:
                 # 1. LISTEN (With Latch Check)
@@ -119,26 +223,28 @@ class JarvisWorker(QThread):
                     self.state_signal.emit("IDLE")
                     self.text_signal.emit("Waiting for Wake Word...")
                 
-                # listen() blocks until speech is detected and finished
-                audio_buffer = await ears.listen()
-                
-                if len(audio_buffer) == 0:
-                    continue
+                # 2. STREAMING TRANSCRIBE
+                # Chunks are fed to STT while the user is still speaking;
+                # only the uncommitted tail is decoded once speech ends.
+                d_stt.start_stream()
+                async for chunk in ears.listen_stream():
+                    d_stt.feed(chunk)
+                    partial = d_stt.partial_text
+                    if partial:
+                        self.text_signal.emit(f"Hearing: {partial}...")
 
-                # 2. TRANSCRIBE
-                text = await d_stt.transcribe(audio_buffer)
+                text = await d_stt.finish_stream()
                 
                 if not text:
                     continue
                 
                 # --- SANITATION ---
                 # Remove punctuation to prevent "Jarvis." -> "." -> Hallucination
-                clean_text = re.sub(r'[^\w\s]', '', text).strip()
+                clean_text = text.translate(_PUNCT_TABLE).strip()
                 if not clean_text:
                     continue
                 # ------------------
                 
-                text_lower = clean_text.lower()
                 logger.info(f"Heard (Clean): '{clean_text}'")
                 self.text_signal.emit(f"Heard: {clean_text}")
 
@@ -147,20 +253,19 @@ class JarvisWorker(QThread):
                 
                 if is_latched:
                     command = clean_text
-                    logger.info(f"Latched command: {command}")
+                    logger.debug(f"Latched command: {command}")
                 else:
-                    # Wake Word Check on CLEAN text
-                    wake_detected = any(variant in text_lower for variant in wake_word_variants)
-                    if wake_detected:
-                        for variant in wake_word_variants:
-                            if variant in text_lower:
-                                # Split only on the first occurrence
-                                parts = text_lower.split(variant, 1)
-                                if len(parts) > 1:
-                                    command = parts[1].strip()
-                                else:
-                                    command = ""
-                                break
+                    # Wake Word Check on CLEAN text (tokens are punctuation-free)
+                    # Fold case per token only up to the first hit; slice the
+                    # original tokens so the command keeps its casing
+                    tokens = clean_text.split()
+                    wake_index = next(
+                        (i for i, token in enumerate(tokens) if token.lower() in WAKE_WORD_VARIANTS),
+                        None
+                    )
+                    if wake_index is not None:
+                        # Everything after the first wake word is the command
+                        command = " ".join(tokens[wake_index + 1:])
                         
                         # If command is empty (e.g. just "Jarvis"), acknowledge but don't act
                         if not command:
@@ -177,13 +282,15 @@ class JarvisWorker(QThread):
 
                 # 4. REFLEX LAYER (The Spine)
                 # Check for instant actions (Stop, Open X)
-                # Pass LOWER case to reflex for matching (insensitive)
-                if await d_spine.check_reflex(command.lower()):
+                # check_reflex folds case itself
+                if await d_spine.check_reflex(command):
                     # If reflex handled it, loop back immediately
                     self.text_signal.emit(f"Reflex: {command}")
                     
-                    # If Stop Command, ensure we reset speaking state
+                    # If Stop Command, drop queued sentences and reset speaking state
                     if "stop" in command.lower():
+                        if self.speaker_task:
+                            self.speaker_task.cancel()
                         self.is_speaking = False
                         
                     ears.activate_latch() # Keep flow open
@@ -192,32 +299,49 @@ class JarvisWorker(QThread):
                 # BARGE-IN GUARD:
                 # If JARVIS is speaking or Music is playing, IGNORE everything else to prevent echo loops.
                 # Only Reflex (above) can interrupt.
-                from src.tools.music import is_music_playing
-                
-                if self.is_speaking or is_music_playing():
+                if self.is_speaking or await is_music_playing():
                     logger.info(f"Ignored '{command}' because audio is active (Barge-In Guard).")
                     continue
                 
                 # 5. EXECUTION (The Brain)
+                # Reply is streamed and spoken sentence by sentence, so audio
+                # starts as soon as the first sentence is complete.
                 self.state_signal.emit("PROCESSING")
                 self.text_signal.emit("Thinking...")
                 
-                response = await d_brain.think(command)
-                self.state_signal.emit("SPEAKING")
-                self.text_signal.emit(response)
+                sentences: asyncio.Queue = asyncio.Queue()
+                # NON-BLOCKING SPEAK (Fire & Forget) allows Barge-In
+                self.speaker_task = asyncio.create_task(self.speak_sentences(sentences))
                 
-                # Wrapper to track speaking state
-                async def speak_task(text):
-                    self.is_speaking = True
+                response = ""
+                pending = ""
+                try:
+                    recalled = await asyncio.to_thread(d_hippocampus.recall, command)
                     try:
-                        await d_tts.speak(text)
-                    finally:
-                        self.is_speaking = False
-
-                # NON-BLOCKING SPEAK (Fire & Forget) allows Barge-In
-                asyncio.create_task(speak_task(response))
+                        d_brain = await brain_task
+                    except Exception as e:
+                        # Rebuild on the next turn instead of re-raising this failure forever
+                        logger.error(f"Brain failed to start: {e}")
+                        brain_task = asyncio.create_task(get_brain())
+                        raise
+                    async for delta in d_brain.think_stream(command, recalled=recalled):
+                        if not response:
+                            self.state_signal.emit("SPEAKING")
+                        response += delta
+                        pending += delta
+                        ready, pending = split_sentences(pending)
+                        for sentence in ready:
+                            sentences.put_nowait(sentence)
+                        self.text_signal.emit(response)
+                    
+                    if pending.strip():
+                        sentences.put_nowait(pending.strip())
+                finally:
+                    # End of reply - queued even on error so the speaker task exits
+                    sentences.put_nowait(None)
+                logger.info(f"Response: '{response}'")
                 
-                d_hippocampus.memorize(f"User: {command} | JARVIS: {response[:100]}", "interaction")
+                memorize_in_background(f"User: {command} | JARVIS: {response[:100]}", "interaction")
                 
                 # Re-activate latch after speaking for flow
                 ears.activate_latch()
@@ -231,8 +355,38 @@ class JarvisWorker(QThread):
                 await asyncio.sleep(1.0) # Backoff
 
 
+def install_signal_wakeup(app: QApplication) -> QSocketNotifier:
+    """
+    Route SIGINT/SIGTERM into the Qt event loop.
+    Qt's C++ loop never returns to Python on its own, so the C-level handler
+    writes to a socket (signal.set_wakeup_fd) that a QSocketNotifier watches.
+    That wakes the interpreter, which runs the Python handler (app.quit).
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: app.quit())
+    
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(lambda *_: rsock.recv(64))
+    # Keep the socket pair alive as long as the notifier
+    notifier.sockets = (rsock, wsock)
+    return notifier
+
+
 def main() -> None:
     """Main entry point."""
+    # Faster event loop for the worker thread where available (no Windows build)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     # Setup Logging
     setup_logging(level=settings.log_level)
     print_banner()
@@ -266,16 +420,21 @@ def main() -> None:
     # Start Worker
     worker.start()
     
+    # Ctrl+C / SIGTERM quit the UI loop; the worker is then cancelled cleanly
+    signal_notifier = install_signal_wakeup(app)
+    
     # Run UI Loop
+    exit_code = 0
     try:
-        sys.exit(app.exec())
-    except KeyboardInterrupt:
-        pass
+        exit_code = app.exec()
     except Exception as e:
         logger.exception("Fatal error in main loop")
-        sys.exit(1)
+        exit_code = 1
     finally:
+        worker.request_stop()
+        worker.wait(3000)
         jarvis_speak("Goodbye, Sheriff.")
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,15 @@
 Brain Module - Agentic LLM Integration
 """
 
-from .llm import d_brain, AgenticBrain
+from . import llm
+from .llm import AgenticBrain, get_brain
 from .prompts import SHERIFF_SYSTEM_PROMPT
 
-__all__ = ["d_brain", "AgenticBrain", "SHERIFF_SYSTEM_PROMPT"]
+
+def __getattr__(name: str):
+    # d_brain is constructed lazily by src.brain.llm
+    if name == "d_brain":
+        return llm.d_brain
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ["d_brain", "get_brain", "AgenticBrain", "SHERIFF_SYSTEM_PROMPT"]
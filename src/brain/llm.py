@@ -4,18 +4,40 @@ Uses prompt engineering for tool calling since Ollama doesn't have native functi
 """
 
 import asyncio
+import functools
+import hashlib
+import inspect
 import os
 import json
+import re
 import subprocess
-import webbrowser
-import pyautogui
-from typing import Dict, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Optional, Any
+from urllib.parse import quote_plus
 from src.core.config import settings
 from src.core.logger import get_logger
 from src.brain.tools import is_destructive_command
+from src.tools.keys import press_key
+from src.tools import music, system_ops
+from src.memory import journal, project_ops
+from src.memory.logger import log_interaction, read_recent_context
 
 logger = get_logger(__name__)
 
+try:
+    # Faster decoder for tool-call JSON; its JSONDecodeError subclasses json's
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Optional dependency - fall back to stdlib
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=256)
+def _norm_app(app_name: str) -> str:
+    """Normalize an app name for lookup (users repeat the same few apps)."""
+    return app_name.lower().strip()
+
 # URI protocols for Windows Store apps
 URI_APPS = {
     "spotify": "spotify:", "whatsapp": "whatsapp:", "netflix": "netflix:",
@@ -32,6 +54,21 @@ COMMON_APPS = {
     "steam": "steam", "telegram": "telegram",
 }
 
+# Media tool actions -> key names
+MEDIA_KEY_MAP = {
+    "volumeup": "volumeup", "volumedown": "volumedown",
+    "mute": "volumemute", "playpause": "playpause",
+    "next": "nexttrack", "previous": "prevtrack"
+}
+
+# Requests that open with a tool verb get Ollama's JSON-constrained decoding;
+# everything else stays free-form so the model can just talk
+TOOL_INTENT_RE = re.compile(
+    r"^\s*(?:please\s+)?(?:open|launch|start|play|stop|pause|search|google|load|add|mark|"
+    r"log|note|list|read|write|run|execute|type|press|click|scan|analy[sz]e|toggle|mute)\b",
+    re.IGNORECASE,
+)
+
 # System prompt for agentic behavior
 AGENT_SYSTEM_PROMPT = """You are Sheriff, an AI Project Manager. Your goal is to help Alfaz ship code.
 
@@ -87,6 +124,65 @@ EXAMPLES:
 IMPORTANT: Return Valid JSON for tools.
 """
 
+# Gemini chat history cap (entries; one user + one model entry per turn, keep it even)
+GEMINI_MAX_HISTORY = 20
+
+# Groq runs in JSON mode; built once so the system prefix is byte-identical every turn
+GROQ_SYSTEM_PROMPT = AGENT_SYSTEM_PROMPT + "\nIMPORTANT: You MUST return valid JSON. Do not include markdown formatting or explanations outside the JSON."
+
+# Returned in place of a reply when the Groq call fails (never cached)
+GROQ_ERROR_REPLY = '{"tool": "error", "message": "Groq Error"}'
+
+# Built once: every turn starts with the same system message object, ahead of the
+# per-turn context/request messages, so the server can reuse its prefix KV cache
+AGENT_SYSTEM_MESSAGE = {"role": "system", "content": AGENT_SYSTEM_PROMPT}
+GROQ_SYSTEM_MESSAGE = {"role": "system", "content": GROQ_SYSTEM_PROMPT}
+
+
+class _BraceTracker:
+    """Incrementally tracks JSON brace depth (string/escape aware) across stream deltas."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_str = False
+        self.escape = False
+        self.opened = False
+
+    def feed(self, delta: str) -> int:
+        """Consume a delta; returns the index in it where the first top-level object closed, else -1."""
+        for i, ch in enumerate(delta):
+            if self.in_str:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_str = False
+            elif ch == '"':
+                self.in_str = True
+            elif ch == "{":
+                self.depth += 1
+                self.opened = True
+            elif ch == "}":
+                self.depth -= 1
+                if self.opened and self.depth == 0:
+                    return i
+        return -1
+
+
+def _extract_first_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text (single pass), or None."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    end = _BraceTracker().feed(text[start:])
+    return text[start:start + end + 1] if end != -1 else None
+
+
+async def _replay(text: str) -> AsyncIterator[str]:
+    """Serve a cached reply through the streaming path as a single delta."""
+    yield text
+
 
 class AgenticBrain:
     """
@@ -96,8 +192,41 @@ class AgenticBrain:
 
     def __init__(self):
         self.provider = settings.llm_provider.lower()
+        
         self._connected = False
+        self._verified = True  # Only Ollama needs a deferred availability probe
         self._pending_confirmation = None
+        # Raw replies keyed on the exact prompt (settings.llm_response_cache_size, 0 = off)
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        
+        # Tool name -> handler, built once (handlers may be sync or async)
+        self._tool_dispatch = {
+            "open_app": self._tool_open_app,
+            "open_url": self._tool_open_url,
+            "web_search": self._tool_web_search,
+            "media": self._tool_media,
+            "play_music": self._tool_play_music,
+            "stop_music": self._tool_stop_music,
+            "analyze_screen": self._tool_analyze_screen,
+            "execute_powershell": self._tool_execute_powershell,
+            "toggle_focus": self._tool_toggle_focus,
+            "load_project": self._tool_load_project,
+            "add_task": self._tool_add_task,
+            "mark_complete": self._tool_mark_complete,
+            "log_blocker": self._tool_log_blocker,
+            "log_entry": self._tool_log_entry,
+            "ui_click": self._tool_ui_click,
+            "ui_scan": self._tool_ui_scan,
+            "read_file": self._tool_read_file,
+            "write_file": self._tool_write_file,
+            "list_files": self._tool_list_files,
+            "run_command": self._tool_run_command,
+            "get_time": self._tool_get_time,
+            "get_clipboard": self._tool_get_clipboard,
+            "type_text": self._tool_type_text,
+            "press_key": self._tool_press_key,
+            "exit": self._tool_exit,
+        }
         
         # Initialize Memory
         from src.memory import d_hippocampus
@@ -114,18 +243,15 @@ class AgenticBrain:
             self._init_ollama()
 
     def _init_ollama(self):
-        """Initialize Ollama (local LLM)."""
+        """
+        Initialize Ollama (local LLM).
+        Connection is assumed; the daemon round-trip is deferred to the first think().
+        """
         try:
             import ollama
-            self.ollama_client = ollama
+            self.ollama_client = ollama.AsyncClient()
             self.ollama_model = settings.ollama_model
-            
-            # Test connection
-            models = ollama.list()
-            available = [m['model'] for m in models.get('models', [])]
-            
-            if self.ollama_model not in available and f"{self.ollama_model}:latest" not in available:
-                logger.warning(f"Model '{self.ollama_model}' not found. Available: {available}")
+            self._verified = False
             
             self._connected = True
             logger.info(f"Agentic Brain initialized with Ollama (model: {self.ollama_model})")
@@ -134,6 +260,21 @@ class AgenticBrain:
             logger.error(f"Failed to connect to Ollama: {e}")
             self._connected = False
 
+    def _start_probe(self) -> None:
+        """Kick off the one-time Ollama model check without delaying the first reply."""
+        self._verified = True
+        self._probe_task = asyncio.create_task(self._probe_ollama())
+
+    async def _probe_ollama(self) -> None:
+        """Warn if the configured model isn't pulled (a failed chat() reports itself)."""
+        try:
+            models = await self.ollama_client.list()
+            available = [m['model'] for m in models.get('models', [])]
+            if self.ollama_model not in available and f"{self.ollama_model}:latest" not in available:
+                logger.warning(f"Model '{self.ollama_model}' not found. Available: {available}")
+        except Exception as e:
+            logger.warning(f"Ollama probe failed: {e}")
+
     def _init_gemini(self):
         """Initialize Gemini as fallback."""
         try:
@@ -150,6 +291,8 @@ class AgenticBrain:
                 system_instruction=AGENT_SYSTEM_PROMPT
             )
             self._chat = self._gemini_model.start_chat()
+            # One ChatSession: overlapping turns would interleave its history
+            self._chat_lock = asyncio.Lock()
             self._connected = True
             logger.info(f"Agentic Brain initialized with Gemini")
             
@@ -160,14 +303,27 @@ class AgenticBrain:
     def _init_groq(self):
         """Initialize Groq (Cloud LLM)."""
         try:
-            from groq import Groq
+            import httpx
+            from groq import AsyncGroq
             
             if not settings.groq_api_key:
                 logger.warning("Groq API Key missing.")
                 self._connected = False
                 return
 
-            self.groq_client = Groq(api_key=settings.groq_api_key)
+            try:
+                import h2  # noqa: F401 - httpx needs it for HTTP/2
+                http2 = True
+            except ImportError:
+                http2 = False
+            
+            # One long-lived pool: later turns reuse the TCP+TLS session
+            http_client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                timeout=httpx.Timeout(60.0, connect=5.0),  # SDK default
+            )
+            self.groq_client = AsyncGroq(api_key=settings.groq_api_key, http_client=http_client)
             self.groq_model = settings.groq_model
             self._connected = True
             logger.info(f"Agentic Brain initialized with Groq (model: {self.groq_model})")
@@ -176,8 +332,17 @@ class AgenticBrain:
             logger.error(f"Failed to initialize Groq: {e}")
             self._connected = False
 
-    async def think(self, text: str) -> str:
-        """Process input through agentic loop."""
+    async def think(self, text: str, recalled: str = "") -> str:
+        """
+        Process input through agentic loop.
+        
+        Args:
+            text: The user request.
+            recalled: Long-term memories relevant to the request (sent as a
+                separate context message so the system prompt stays cacheable).
+        """
+        if not self._verified:
+            self._start_probe()
         if not self._connected:
             return "I'm offline, Sheriff. Check my configuration."
 
@@ -188,115 +353,277 @@ class AgenticBrain:
             if self._pending_confirmation:
                 return await self._handle_confirmation(text)
             
-            # Get memory context
-            # Get memory context
-            from src.memory.logger import read_recent_context
-            from src.memory.project_ops import current_project
+            messages = await self._build_messages(text, recalled)
+            cache_key = self._cache_key(messages)
             
-            mem_context = read_recent_context(limit=3)
-            proj_context = f"CURRENT PROJECT: {current_project['alias']}" if current_project['alias'] else "NO PROJECT LOADED"
+            # Get LLM response
+            response = self._cache_get(cache_key)
+            if response is None:
+                if self.provider == "ollama":
+                    response = await self._think_ollama(messages, json_mode=bool(TOOL_INTENT_RE.match(text)))
+                elif self.provider == "groq":
+                    response = await self._think_groq(messages)
+                else:
+                    response = await self._think_gemini(messages)
+                self._cache_put(cache_key, response)
             
-            # Construct prompt with context
-            full_prompt = f"{proj_context}\nCONTEXT:\n{mem_context}\n\nUSER REQUEST: {text}"
+            return await self._resolve_response(text, response.strip())
+
+        except Exception as e:
+            logger.error(f"Agent error: {e}", exc_info=True)
+            return "I encountered an error, Sheriff."
+
+    async def think_stream(self, text: str, recalled: str = "") -> AsyncIterator[str]:
+        """
+        Streaming variant of think().
+        Plain-text replies are yielded as the tokens arrive so speech can start
+        on the first sentence. Tool calls (JSON) are buffered, executed, and
+        their result is yielded once.
+        """
+        if not self._verified:
+            self._start_probe()
+        if not self._connected:
+            yield "I'm offline, Sheriff. Check my configuration."
+            return
+
+        try:
+            logger.info(f"Agent thinking (stream): '{text}'")
             
-            # Get LLM response
-            if self.provider == "ollama":
-                response = await self._think_ollama(full_prompt)
-            elif self.provider == "groq":
-                response = await self._think_groq(full_prompt)
-            else:
-                response = await self._think_gemini(full_prompt)
+            if self._pending_confirmation:
+                yield await self._handle_confirmation(text)
+                return
             
-            response = response.strip()
+            messages = await self._build_messages(text, recalled)
             
-            # Check if response is a tool call (JSON)
-            if response.startswith("{") or '{"tool"' in response:
-                result = await self._execute_tool(response)
-                
-                # If waiting for confirmation, return the question
-                if self._pending_confirmation:
-                    return self._pending_confirmation["question"]
-                
-                # Log meaningful interactions
-                if result and "Error" not in result:
-                    from src.memory.logger import log_interaction
-                    log_interaction(text, str(result)[:200])
-                    
-                return result
+            response = ""
+            emitted = 0
+            is_tool_call = None  # Decided on the first non-whitespace character
+            braces = _BraceTracker()
             
-            return response
+            cache_key = self._cache_key(messages)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                stream = _replay(cached)
+            else:
+                stream = self._stream_provider(messages, json_mode=bool(TOOL_INTENT_RE.match(text)))
+            try:
+                async for delta in stream:
+                    response += delta
+                    if is_tool_call is None:
+                        head = response.lstrip()
+                        # Wait for a full fence before deciding ("`" alone is ambiguous)
+                        if not head or (head[0] == "`" and len(head) < 3):
+                            continue
+                        # Bare or fenced JSON (Gemini usually wraps it in ```json)
+                        is_tool_call = head.startswith(("{", "```"))
+                        if is_tool_call:
+                            delta = head
+                    if is_tool_call:
+                        # Execute as soon as the object closes; trailing tokens are noise
+                        if braces.feed(delta) != -1:
+                            if self.provider == "gemini":
+                                # The chat session only records the turn (and trims
+                                # its history) once the stream is fully consumed
+                                async for _ in stream:
+                                    pass
+                            break
+                        continue
+                    
+                    # Hold back anything from a '{' or '`' on - it may be an inline
+                    # (or fenced) tool call
+                    held = [i for i in (response.find("{", emitted), response.find("`", emitted)) if i != -1]
+                    safe_end = min(held) if held else len(response)
+                    if safe_end > emitted:
+                        yield response[emitted:safe_end]
+                        emitted = safe_end
+            finally:
+                await stream.aclose()
+            if cached is None:
+                self._cache_put(cache_key, response)
+            
+            remainder = response[emitted:].strip()
+            if is_tool_call or '{"tool"' in remainder:
+                yield await self._resolve_response(text, response.strip(), is_tool_call=True)
+            elif remainder:
+                yield remainder
 
         except Exception as e:
             logger.error(f"Agent error: {e}", exc_info=True)
-            return "I encountered an error, Sheriff."
-
-    async def _think_ollama(self, prompt: str) -> str:
-        """Send prompt to Ollama."""
-        loop = asyncio.get_running_loop()
+            yield "I encountered an error, Sheriff."
+
+    async def _build_messages(self, text: str, recalled: str = "") -> list[dict]:
+        """
+        Build the per-turn messages that follow the static system prompt.
+        Volatile context (project, recent log, recalled memories) lives in its own
+        message so the system prefix never changes and provider prompt caching hits.
+        """
+        # File read off the loop so HUD signals and TTS keep running meanwhile
+        mem_context = await asyncio.to_thread(read_recent_context, 3)
+        current_project = project_ops.current_project
+        proj_context = f"CURRENT PROJECT: {current_project['alias']}" if current_project['alias'] else "NO PROJECT LOADED"
+        
+        # Least to most volatile: the project line is identical across most turns
+        context = f"CONTEXT:\n{mem_context}"
+        if recalled:
+            context += f"\n{recalled}"
+        
+        return [
+            {"role": "user", "content": proj_context},
+            {"role": "user", "content": context},
+            {"role": "user", "content": f"USER REQUEST: {text}"},
+        ]
+
+    def _cache_key(self, messages: list[dict]) -> Optional[bytes]:
+        """Digest of provider, model and the per-turn messages (None when caching is off)."""
+        if not settings.llm_response_cache_size:
+            return None
+        model = getattr(settings, f"{self.provider}_model", "")
+        payload = "\0".join([self.provider, model, *(m["content"] for m in messages)])
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: Optional[bytes]) -> Optional[str]:
+        if key is None or key not in self._response_cache:
+            return None
+        self._response_cache.move_to_end(key)
+        logger.debug("LLM response cache hit")
+        return self._response_cache[key]
+
+    def _cache_put(self, key: Optional[bytes], response: str) -> None:
+        # Raw model output only: tool calls in it are still executed on every hit
+        if key is None or not response or response == GROQ_ERROR_REPLY:
+            return
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > settings.llm_response_cache_size:
+            self._response_cache.popitem(last=False)
+
+    @staticmethod
+    def _flatten_messages(messages: list[dict]) -> str:
+        """Join per-turn messages into one prompt (Gemini chat takes a single string)."""
+        return "\n\n".join(m["content"] for m in messages)
+
+    async def _resolve_response(
+        self, text: str, response: str, is_tool_call: Optional[bool] = None
+    ) -> str:
+        """
+        Execute the response if it is a tool call, otherwise return it as speech.
+        Callers that already classified the reply pass is_tool_call to skip detection.
+        """
+        if is_tool_call is None:
+            # Prefix check covers bare and fenced JSON; the scan only catches inline calls
+            head = response[:3]
+            is_tool_call = head[:1] == "{" or head == "```" or '{"tool"' in response
+        
+        if is_tool_call:
+            result = await self._execute_tool(response)
+            
+            # If waiting for confirmation, return the question
+            if self._pending_confirmation:
+                return self._pending_confirmation["question"]
+            
+            # Log meaningful interactions
+            if result and "Error" not in result:
+                log_interaction(text, str(result)[:200])
+                
+            return result
         
-        def _call():
-            messages = [
-                {"role": "system", "content": AGENT_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-            response = self.ollama_client.chat(
+        return response
+
+    async def _stream_provider(
+        self, messages: list[dict], json_mode: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream raw text deltas from the active provider.
+        json_mode constrains Ollama to a JSON object (Groq always runs in JSON mode).
+        """
+        if self.provider == "ollama":
+            stream = await self.ollama_client.chat(
                 model=self.ollama_model,
-                messages=messages
+                messages=[AGENT_SYSTEM_MESSAGE, *messages],
+                format="json" if json_mode else "",
+                stream=True
             )
-            return response['message']['content']
-        
-        return await loop.run_in_executor(None, _call)
-
-    async def _think_gemini(self, prompt: str) -> str:
-        """Send prompt to Gemini."""
-        loop = asyncio.get_running_loop()
-        response = await loop.run_in_executor(
-            None, self._chat.send_message, prompt
+            async for chunk in stream:
+                if chunk['message']['content']:
+                    yield chunk['message']['content']
+        elif self.provider == "groq":
+            stream = await self.groq_client.chat.completions.create(
+                messages=[GROQ_SYSTEM_MESSAGE, *messages],
+                model=self.groq_model,
+                temperature=0.3,
+                max_tokens=1024,
+                response_format={"type": "json_object"},
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        else:
+            async with self._chat_lock:
+                stream = await self._chat.send_message_async(
+                    self._flatten_messages(messages), stream=True
+                )
+                async for chunk in stream:
+                    if chunk.text:
+                        yield chunk.text
+                self._trim_gemini_history()
+
+    async def _think_ollama(self, messages: list[dict], json_mode: bool = False) -> str:
+        """Send messages to Ollama (json_mode forces a parseable JSON object)."""
+        response = await self.ollama_client.chat(
+            model=self.ollama_model,
+            messages=[AGENT_SYSTEM_MESSAGE, *messages],
+            format="json" if json_mode else ""
         )
+        return response['message']['content']
+
+    async def _think_gemini(self, messages: list[dict]) -> str:
+        """Send messages to Gemini (system prompt is set once as system_instruction)."""
+        async with self._chat_lock:
+            response = await self._chat.send_message_async(self._flatten_messages(messages))
+            self._trim_gemini_history()
         return response.text.strip()
 
-    async def _think_groq(self, prompt: str) -> str:
-        """Send prompt to Groq."""
-        loop = asyncio.get_running_loop()
-        
-        def _call():
-            import time
-            start = time.time()
-            try:
-                chat_completion = self.groq_client.chat.completions.create(
-                    messages=[
-                        {"role": "system", "content": AGENT_SYSTEM_PROMPT + "\nIMPORTANT: You MUST return valid JSON. Do not include markdown formatting or explanations outside the JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    model=self.groq_model,
-                    temperature=0.3, # Lower temperature for better tool usage
-                    max_tokens=1024,
-                    response_format={"type": "json_object"}
-                )
-                duration = time.time() - start
-                logger.debug(f"Groq API Duration: {duration:.2f}s")
-                return chat_completion.choices[0].message.content
-            except Exception as e:
-                logger.error(f"Groq API Error: {e}")
-                return '{"tool": "error", "message": "Groq Error"}'
+    def _trim_gemini_history(self) -> None:
+        """Keep the chat session's history (resent every turn) to the last few turns."""
+        if len(self._chat.history) > GEMINI_MAX_HISTORY:
+            self._chat.history = self._chat.history[-GEMINI_MAX_HISTORY:]
 
-        return await loop.run_in_executor(None, _call)
+    async def _think_groq(self, messages: list[dict]) -> str:
+        """Send messages to Groq."""
+        import time
+        start = time.time()
+        try:
+            chat_completion = await self.groq_client.chat.completions.create(
+                messages=[GROQ_SYSTEM_MESSAGE, *messages],
+                model=self.groq_model,
+                temperature=0.3, # Lower temperature for better tool usage
+                max_tokens=1024,
+                response_format={"type": "json_object"}
+            )
+            duration = time.time() - start
+            logger.debug(f"Groq API Duration: {duration:.2f}s")
+            return chat_completion.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Groq API Error: {e}")
+            return GROQ_ERROR_REPLY
 
     async def _execute_tool(self, response: str) -> str:
         """Parse JSON and execute tool."""
         try:
             # 1. Attempt to find JSON blob
             try:
-                # Find first { and last }
-                start = response.find("{")
-                end = response.rfind("}") + 1
-                
-                if start != -1 and end > start:
-                    potential_json = response[start:end]
-                    data = json.loads(potential_json)
+                clean = response.strip()
+                if clean[:1] == "{" and clean[-1:] == "}":
+                    # Fast path: JSON mode returns a bare object, no scanning needed
+                    data = _loads(clean.encode())
                 else:
-                    # No JSON found?
-                    return response
+                    # First balanced object, wherever it sits (prose, code fences)
+                    potential_json = _extract_first_json(response)
+                    if potential_json is None:
+                        # No JSON found?
+                        return response
+                    data = _loads(potential_json)
             except json.JSONDecodeError:
                 # 2. Try simple cleanup (Markdown code blocks)
                 try:
@@ -305,7 +632,7 @@ class AgenticBrain:
                     end = clean.rfind("}") + 1
                     if start != -1 and end > start:
                         clean = clean[start:end]
-                    data = json.loads(clean)
+                    data = _loads(clean)
                 except:
                     # Failed to parse. DO NOT return raw JSON as speech.
                     logger.error(f"Failed to parse JSON tool call: {response}")
@@ -315,161 +642,13 @@ class AgenticBrain:
             
             logger.info(f"Executing tool: {tool}")
             
-            if tool == "open_app":
-                return self._open_app(data.get("app", ""))
-            
-            elif tool == "open_url":
-                url = data.get("url", "")
-                if not url.startswith("http"):
-                    url = f"https://{url}"
-                webbrowser.open(url)
-                return f"Opening {url.replace('https://', '').split('/')[0]}"
-            
-            elif tool == "web_search":
-                query = data.get("query", "")
-                webbrowser.open(f"https://www.google.com/search?q={query.replace(' ', '+')}")
-                return f"Searching for {query}"
-            
-            elif tool == "media":
-                action = data.get("action", "")
-                key_map = {
-                    "volumeup": "volumeup", "volumedown": "volumedown",
-                    "mute": "volumemute", "playpause": "playpause",
-                    "next": "nexttrack", "previous": "prevtrack"
-                }
-                pyautogui.press(key_map.get(action, action))
-                return "Done, Sheriff." if "volume" in action else "Media controlled."
-            
-            elif tool == "play_music":
-                from src.tools.music import play_music
-                song = data.get("song", "")
-                return play_music(song)
-            
-
-            
-            elif tool == "stop_music":
-                from src.tools.music import stop_music
-                return stop_music()
-            
-            elif tool == "analyze_screen":
-                from src.senses.vision import analyze_screen
-                prompt = data.get("prompt", "Describe what is on my screen.")
-                return analyze_screen(prompt)
-
-            elif tool == "execute_powershell":
-                from src.tools.system_ops import execute_powershell
-                script = data.get("script", "")
-                if is_destructive_command(script):
-                    return self._ask_for_permission(script)
-                return execute_powershell(script)
-
-            elif tool == "toggle_focus":
-                from src.tools.system_ops import toggle_focus_mode
-                state = data.get("state", False)
-                return toggle_focus_mode(state)
-
-            # --- Project Ops Tools ---
-            elif tool == "load_project":
-                from src.memory.project_ops import load_project_context
-                return load_project_context(data.get("alias", ""))
-            
-            elif tool == "add_task":
-                from src.memory.project_ops import add_task
-                return add_task(data.get("task", ""))
-            
-            elif tool == "mark_complete":
-                from src.memory.project_ops import mark_complete
-                return mark_complete(data.get("keyword", ""))
-                
-            elif tool == "log_blocker":
-                from src.memory.project_ops import log_blocker
-                return log_blocker(data.get("issue", ""))
-            
-            elif tool == "log_entry":
-                from src.memory.journal import log
-                return log("USER", data.get("entry", ""))
-                
-            elif tool == "ui_click":
-                from src.tools.ui_ops import ui_click
-                return ui_click(data.get("app", ""), data.get("target", ""))
-            
-            elif tool == "ui_scan":
-                from src.tools.ui_ops import ui_scan
-                return ui_scan(data.get("app", ""))
-            # -------------------------
-            
-            elif tool == "read_file":
-                path = data.get("path", "")
-                if os.path.exists(path):
-                    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        if len(content) > 2000:
-                            content = content[:2000] + "\n...[truncated]"
-                        return f"Contents of {os.path.basename(path)}:\n{content}"
-                return f"File not found: {path}"
-            
-            elif tool == "write_file":
-                path = data.get("path", "")
-                content = data.get("content", "")
-                os.makedirs(os.path.dirname(path), exist_ok=True) if os.path.dirname(path) else None
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return f"Written to {os.path.basename(path)}"
-            
-            elif tool == "list_files":
-                path = data.get("path", ".")
-                if os.path.exists(path):
-                    items = os.listdir(path)
-                    folders = [f"📁 {i}" for i in items if os.path.isdir(os.path.join(path, i))]
-                    files = [f"📄 {i}" for i in items if os.path.isfile(os.path.join(path, i))]
-                    result = folders[:20] + files[:20]
-                    return f"Contents of {path}:\n" + "\n".join(result[:30])
-                return f"Directory not found: {path}"
-            
-            elif tool == "run_command":
-                command = data.get("command", "")
-                
-                if is_destructive_command(command):
-                    self._pending_confirmation = {
-                        "command": command,
-                        "question": f"This may be destructive: {command}. Proceed, Sheriff?"
-                    }
-                    return "Waiting for confirmation"
-                
-                return self._run_command(command)
-            
-            elif tool == "get_time":
-                from datetime import datetime
-                now = datetime.now()
-                return f"It's {now.strftime('%I:%M %p')} on {now.strftime('%A, %B %d')}, Sheriff."
-            
-            elif tool == "get_clipboard":
-                import pyperclip
-                try:
-                    content = pyperclip.paste()
-                    if content:
-                        return f"Clipboard contents: {content[:500]}"
-                    return "Clipboard is empty, Sheriff."
-                except:
-                    return "Couldn't access clipboard, Sheriff."
-            
-            elif tool == "type_text":
-                text = data.get("text", "")
-                pyautogui.typewrite(text, interval=0.02)
-                return f"Typed the text, Sheriff."
-            
-            elif tool == "press_key":
-                key = data.get("key", "")
-                pyautogui.press(key)
-                return f"Pressed {key}, Sheriff."
-            
-            elif tool == "exit":
-                import sys
-                print("\n🤖 JARVIS: Goodbye, Sheriff.")
-                sys.exit(0)
-            
-            else:
+            handler = self._tool_dispatch.get(tool)
+            if handler is None:
                 return f"Unknown tool: {tool}"
+            result = handler(data)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
                 
         except json.JSONDecodeError:
             # Not valid JSON, return as plain text
@@ -478,39 +657,232 @@ class AgenticBrain:
             logger.error(f"Tool error: {e}")
             return f"Error: {str(e)}"
 
+    # --- Tool Handlers (one per tool name, see _tool_dispatch) ---
+    def _tool_open_app(self, data: dict) -> str:
+        return self._open_app(data.get("app", ""))
+
+    def _tool_open_url(self, data: dict) -> str:
+        url = data.get("url", "")
+        if not url.startswith("http"):
+            url = f"https://{url}"
+        import webbrowser
+        webbrowser.open(url)
+        return f"Opening {url.replace('https://', '').split('/')[0]}"
+
+    def _tool_web_search(self, data: dict) -> str:
+        query = data.get("query", "")
+        import webbrowser
+        webbrowser.open(f"https://www.google.com/search?q={quote_plus(query)}")
+        return f"Searching for {query}"
+
+    def _tool_media(self, data: dict) -> str:
+        action = data.get("action", "")
+        press_key(MEDIA_KEY_MAP.get(action, action))
+        return "Done, Sheriff." if "volume" in action else "Media controlled."
+
+    async def _tool_play_music(self, data: dict) -> str:
+        return await music.play_music(data.get("song", ""))
+
+    async def _tool_stop_music(self, data: dict) -> str:
+        return await music.stop_music()
+
+    async def _tool_analyze_screen(self, data: dict) -> str:
+        from src.senses.vision import analyze_screen
+        return await analyze_screen(data.get("prompt", "Describe what is on my screen."))
+
+    def _tool_execute_powershell(self, data: dict) -> str:
+        script = data.get("script", "")
+        if is_destructive_command(script):
+            return self._ask_for_permission(script)
+        return system_ops.execute_powershell(script)
+
+    def _tool_toggle_focus(self, data: dict) -> str:
+        return system_ops.toggle_focus_mode(data.get("state", False))
+
+    def _tool_load_project(self, data: dict) -> str:
+        return project_ops.load_project_context(data.get("alias", ""))
+
+    def _tool_add_task(self, data: dict) -> str:
+        return project_ops.add_task(data.get("task", ""))
+
+    def _tool_mark_complete(self, data: dict) -> str:
+        return project_ops.mark_complete(data.get("keyword", ""))
+
+    def _tool_log_blocker(self, data: dict) -> str:
+        return project_ops.log_blocker(data.get("issue", ""))
+
+    def _tool_log_entry(self, data: dict) -> str:
+        return journal.log("USER", data.get("entry", ""))
+
+    def _tool_ui_click(self, data: dict) -> str:
+        from src.tools.ui_ops import ui_click
+        return ui_click(data.get("app", ""), data.get("target", ""))
+
+    def _tool_ui_scan(self, data: dict) -> str:
+        from src.tools.ui_ops import ui_scan
+        return ui_scan(data.get("app", ""))
+
+    def _tool_read_file(self, data: dict) -> str:
+        path = data.get("path", "")
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                # Bounded read: one char past the limit tells us if we truncated
+                content = f.read(2001)
+                if len(content) > 2000:
+                    content = content[:2000] + "\n...[truncated]"
+                return f"Contents of {os.path.basename(path)}:\n{content}"
+        return f"File not found: {path}"
+
+    def _tool_write_file(self, data: dict) -> str:
+        path = data.get("path", "")
+        content = data.get("content", "")
+        os.makedirs(os.path.dirname(path), exist_ok=True) if os.path.dirname(path) else None
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return f"Written to {os.path.basename(path)}"
+
+    def _tool_list_files(self, data: dict) -> str:
+        path = data.get("path", ".")
+        if os.path.exists(path):
+            folders, files = [], []
+            # DirEntry carries the type from readdir - no extra stat per item
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if len(folders) < 20:
+                            folders.append(f"📁 {entry.name}")
+                    elif entry.is_file():
+                        if len(files) < 20:
+                            files.append(f"📄 {entry.name}")
+                    # 20 folders + 10 files already fill the 30-line reply
+                    if len(folders) >= 20 and len(files) >= 10:
+                        break
+            result = folders + files
+            return f"Contents of {path}:\n" + "\n".join(result[:30])
+        return f"Directory not found: {path}"
+
+    async def _tool_run_command(self, data: dict) -> str:
+        command = data.get("command", "")
+        
+        if is_destructive_command(command):
+            self._pending_confirmation = {
+                "command": command,
+                "question": f"This may be destructive: {command}. Proceed, Sheriff?"
+            }
+            return "Waiting for confirmation"
+        
+        return await self._run_command(command)
+
+    def _tool_get_time(self, data: dict) -> str:
+        from datetime import datetime
+        now = datetime.now()
+        return f"It's {now.strftime('%I:%M %p')} on {now.strftime('%A, %B %d')}, Sheriff."
+
+    def _tool_get_clipboard(self, data: dict) -> str:
+        import pyperclip
+        try:
+            content = pyperclip.paste()
+            if content:
+                return f"Clipboard contents: {content[:500]}"
+            return "Clipboard is empty, Sheriff."
+        except:
+            return "Couldn't access clipboard, Sheriff."
+
+    async def _tool_type_text(self, data: dict) -> str:
+        import pyautogui
+        text = data.get("text", "")
+        if "\t" in text or "\n" in text:
+            # Editors may reformat pasted tabs/newlines; send real keystrokes
+            pyautogui.typewrite(text, interval=0)
+        else:
+            # One paste instead of a keystroke per character
+            import pyperclip
+            previous = pyperclip.paste()
+            pyperclip.copy(text)
+            pyautogui.hotkey("ctrl", "v")
+            await asyncio.sleep(0.05)  # Let the target read the clipboard first
+            pyperclip.copy(previous)
+        return f"Typed the text, Sheriff."
+
+    def _tool_press_key(self, data: dict) -> str:
+        key = data.get("key", "")
+        press_key(key)
+        return f"Pressed {key}, Sheriff."
+
+    def _tool_exit(self, data: dict) -> str:
+        import sys
+        print("\n🤖 JARVIS: Goodbye, Sheriff.")
+        sys.exit(0)
+
     def _open_app(self, app_name: str) -> str:
         """Open an application."""
-        app = app_name.lower().strip()
+        app = _norm_app(app_name)
         
         if app in URI_APPS:
-            os.system(f'start "" "{URI_APPS[app]}"')
-            return f"Opening {app_name}."
-        
-        if app in COMMON_APPS:
-            exe = COMMON_APPS[app]
-            subprocess.Popen(f'powershell -Command "Start-Process \'{exe}\' -ErrorAction SilentlyContinue"',
-                           shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # ShellExecute handles protocol URIs natively - no cmd.exe
+            os.startfile(URI_APPS[app])
             return f"Opening {app_name}."
         
-        subprocess.Popen(f'powershell -Command "Start-Process \'{app}\' -ErrorAction SilentlyContinue"',
-                        shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self._launch(COMMON_APPS.get(app, app))
         return f"Opening {app_name}."
 
-    def _run_command(self, command: str) -> str:
-        """Run terminal command."""
+    @staticmethod
+    def _launch(exe: str) -> None:
+        """Launch via ShellExecute; only spawn a process directly if that fails."""
+        try:
+            os.startfile(exe)
+        except OSError:
+            try:
+                subprocess.Popen([exe], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError as e:
+                logger.warning(f"Could not launch '{exe}': {e}")
+
+    async def _run_command(self, command: str) -> str:
+        """Run terminal command without blocking the event loop."""
         try:
-            result = subprocess.run(
-                command, shell=True, capture_output=True, text=True, timeout=30
+            proc = await asyncio.create_subprocess_shell(
+                command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),  # Output is captured
+            )
+            try:
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_capped(proc.stdout),
+                        self._read_capped(proc.stderr),
+                        proc.wait(),
+                    ),
+                    timeout=30.0,
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return "Command timed out."
+            output = (
+                stdout.decode(errors="replace") or stderr.decode(errors="replace")
+                or "Command completed."
             )
-            output = result.stdout or result.stderr or "Command completed."
             if len(output) > 500:
                 output = output[:500] + "\n...[truncated]"
             return output
-        except subprocess.TimeoutExpired:
-            return "Command timed out."
         except Exception as e:
             return f"Failed: {str(e)}"
 
+    @staticmethod
+    async def _read_capped(stream: asyncio.StreamReader, limit: int = 2048) -> bytes:
+        """
+        Keep the first `limit` bytes (enough for the 500-char reply) and drain the rest,
+        so chatty commands neither pile up in memory nor block on a full pipe.
+        """
+        kept = bytearray()
+        while len(kept) < limit:
+            chunk = await stream.read(limit - len(kept))
+            if not chunk:
+                return bytes(kept)
+            kept += chunk
+        while await stream.read(65536):
+            pass
+        return bytes(kept)
+
     async def _handle_confirmation(self, text: str) -> str:
         """Handle confirmation for destructive commands."""
         text_lower = text.lower()
@@ -518,12 +890,38 @@ class AgenticBrain:
         if any(word in text_lower for word in ["yes", "proceed", "do it", "confirm", "go"]):
             command = self._pending_confirmation["command"]
             self._pending_confirmation = None
-            result = self._run_command(command)
+            result = await self._run_command(command)
             return f"Done. {result[:100]}"
         else:
             self._pending_confirmation = None
             return "Cancelled, Sheriff."
 
 
-# Singleton instance
-d_brain = AgenticBrain()
+# Singleton instance, built on first access (PEP 562) so importing src.brain stays cheap
+_d_brain: Optional[AgenticBrain] = None
+_d_brain_lock = threading.Lock()
+
+
+def _build_brain() -> AgenticBrain:
+    global _d_brain
+    # Lock: get_brain() may be building it on a worker thread
+    with _d_brain_lock:
+        if _d_brain is None:
+            _d_brain = AgenticBrain()
+    return _d_brain
+
+
+async def get_brain() -> AgenticBrain:
+    """
+    Return the singleton, constructing it on a worker thread the first time so
+    SDK imports and client setup overlap with whatever the caller does meanwhile.
+    """
+    if _d_brain is not None:
+        return _d_brain
+    return await asyncio.to_thread(_build_brain)
+
+
+def __getattr__(name: str):
+    if name == "d_brain":
+        return _d_brain if _d_brain is not None else _build_brain()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
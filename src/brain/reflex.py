@@ -5,21 +5,61 @@ Handles immediate, non-cognitive actions to bypass the LLM for speed.
 
 import re
 import os
-import webbrowser
-import subprocess
+import sys
+from datetime import datetime
 from src.core.logger import get_logger
 from src.senses.tts import d_tts
+from src.tools import music
+from src.tools.keys import press_key
 
 logger = get_logger(__name__)
 
+# Launch commands for the "open <app>" reflex
+APP_COMMANDS = {
+    "calc": ("calc",), "calculator": ("calc",),
+    "notepad": ("notepad",),
+    "cmd": ("wt",), "terminal": ("wt",), # Windows Terminal
+    "explorer": ("explorer",),
+    "code": ("code",), "vscode": ("code",),
+}
+
 class ReflexSpine:
+    # Every target the "open <site>" alternative can capture
+    _URL_MAP = {
+        "google": "https://www.google.com",
+        "youtube": "https://www.youtube.com",
+        "reddit": "https://www.reddit.com",
+        "github": "https://www.github.com",
+        "gmail": "https://mail.google.com",
+        "mail": "https://mail.google.com",
+    }
+
     def __init__(self):
-        # Compiled regex patterns for speed
-        self.patterns = {
-            "stop": re.compile(r"^(stop|quiet|silence|shut up|mute)$", re.IGNORECASE),
-            "open_url": re.compile(r"^open (google|youtube|reddit|github|gmail|mail)(?:\.com)?$", re.IGNORECASE),
-            "open_app": re.compile(r"^open (calc|calculator|notepad|cmd|terminal|explorer|spotify|code|vscode)$", re.IGNORECASE),
-            "time": re.compile(r"^(what time is it|time check|current time)$", re.IGNORECASE),
+        # One alternation checked with fullmatch: a single C-level match per command,
+        # and m.lastgroup names the reflex. Alternatives are tried in priority order.
+        # The named groups are the only captures; everything else is (?:...).
+        self.pattern = re.compile(
+            r"(?P<stop>stop|quiet|silence|shut up|mute)"
+            r"|open (?P<url>google|youtube|reddit|github|gmail|mail)(?:\.com)?"
+            r"|open (?P<app>calc|calculator|notepad|cmd|terminal|explorer|spotify|code|vscode)"
+            r"|(?P<time>what time is it|what'?s the time|what is the time|time check|current time)"
+            r"|(?P<greeting>(?:hi|hello|hey)(?: there| jarvis| sheriff)?)"
+        )
+        # Fuzzy phrases that may appear anywhere in the command
+        self.volume_pattern = re.compile(
+            r"\b(?:(?P<volume_up>volume up|turn it up)"
+            r"|(?P<volume_down>volume down|turn it down|turn down)"
+            r"|(?P<mute_toggle>mute|unmute))\b"
+        )
+        self._handlers = {
+            "stop": self._do_stop,
+            "url": self._do_url,
+            "app": self._do_app,
+            "time": self._do_time,
+            "greeting": self._do_greeting,
+            "volume_up": self._do_volume_up,
+            "volume_down": self._do_volume_down,
+            "mute_toggle": self._do_mute,
         }
 
     async def check_reflex(self, command: str) -> bool:
@@ -27,74 +67,67 @@ class ReflexSpine:
         Check if command matches a reflex pattern.
         If yes, execute immediately and return True.
         """
-        command = command.strip()
-        
-        # 1. Stop/Silence (Highest Priority)
-        if self.patterns["stop"].match(command):
-            logger.info(f"Reflex triggered: STOP")
-            d_tts.stop() # Kill audio
-            return True
-
-        # 2. Open Common URLs
-        match = self.patterns["open_url"].match(command)
-        if match:
-            target = match.group(1).lower()
-            url = f"https://www.{target}.com" if "." not in target else f"https://{target}"
-            if target == "gmail" or target == "mail":
-                url = "https://mail.google.com"
-            
-            logger.info(f"Reflex triggered: OPEN URL {url}")
-            await d_tts.speak(f"Opening {target}.")
-            webbrowser.open(url)
-            return True
-
-        # 3. Open Common Apps
-        match = self.patterns["open_app"].match(command)
-        if match:
-            app = match.group(1).lower()
-            logger.info(f"Reflex triggered: OPEN APP {app}")
-            await d_tts.speak(f"Opening {app}.")
-            
-            if app in ["calc", "calculator"]:
-                subprocess.Popen("calc")
-            elif app == "notepad":
-                subprocess.Popen("notepad")
-            elif app in ["cmd", "terminal"]:
-                subprocess.Popen("wt") # Windows Terminal
-            elif app == "explorer":
-                subprocess.Popen("explorer")
-            elif app == "spotify":
-                os.system("start spotify:")
-            elif app in ["code", "vscode"]:
-                subprocess.Popen("code")
-            return True
-
-        # 4. Time Check
-        if self.patterns["time"].match(command):
-            from datetime import datetime
-            now = datetime.now().strftime("%I:%M %p")
-            logger.info(f"Reflex triggered: TIME")
-            await d_tts.speak(f"It is {now}.")
-            return True
-
-        # 5. Volume Control (PowerShell)
-        if "volume up" in command or "turn it up" in command:
-            logger.info("Reflex: Volume Up")
-            subprocess.Popen(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]175)"]) 
-            return True
-            
-        if "volume down" in command or "turn it down" in command or "turn down" in command:
-            logger.info("Reflex: Volume Down")
-            for _ in range(3): # Lower it significantly
-                subprocess.Popen(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]174)"]) 
-            return True
-            
-        if "mute" in command or "unmute" in command:
-            logger.info("Reflex: Mute/Unmute")
-            subprocess.Popen(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]173)"]) 
-            return True
-
-        return False
+        # Fold case once; the patterns are lowercase and compiled without IGNORECASE
+        command = command.strip().lower()
+
+        match = self.pattern.fullmatch(command) or self.volume_pattern.search(command)
+        if not match:
+            return False
+
+        await self._handlers[match.lastgroup](match.group(match.lastgroup))
+        return True
+
+    async def _do_stop(self, _: str) -> None:
+        # Highest priority
+        logger.info("Reflex triggered: STOP")
+        d_tts.stop() # Kill audio
+        await music.stop_music() # And any background track
+
+    async def _do_url(self, target: str) -> None:
+        url = self._URL_MAP[target]
+
+        logger.info("Reflex triggered: OPEN URL %s", url)
+        await d_tts.speak(f"Opening {target}.")
+        import webbrowser
+        webbrowser.open(url)
+
+    async def _do_app(self, app: str) -> None:
+        logger.info("Reflex triggered: OPEN APP %s", app)
+        await d_tts.speak(f"Opening {app}.")
+
+        if app == "spotify":
+            os.startfile("spotify:")
+            return
+        import subprocess
+        # Detach so the launched app neither inherits our console nor holds handles open
+        flags = 0
+        if sys.platform == "win32":
+            flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        subprocess.Popen(APP_COMMANDS[app], creationflags=flags, close_fds=True)
+
+    async def _do_time(self, _: str) -> None:
+        now = datetime.now().strftime("%I:%M %p")
+        logger.info("Reflex triggered: TIME")
+        await d_tts.speak(f"It is {now}.")
+
+    async def _do_greeting(self, _: str) -> None:
+        # The system prompt's canned small-talk reply
+        logger.info("Reflex triggered: GREETING")
+        await d_tts.speak("Hello Sheriff. Ready to ship?")
+
+    # Volume Control (media keys via SendInput, no PowerShell spawn)
+    async def _do_volume_up(self, _: str) -> None:
+        logger.info("Reflex: Volume Up")
+        press_key("volumeup")
+
+    async def _do_volume_down(self, _: str) -> None:
+        logger.info("Reflex: Volume Down")
+        for _ in range(3): # Lower it significantly
+            press_key("volumedown")
+
+    async def _do_mute(self, _: str) -> None:
+        logger.info("Reflex: Mute/Unmute")
+        press_key("volumemute")
 
 # Singleton
 d_spine = ReflexSpine()
@@ -3,6 +3,9 @@ Tool Definitions for the Agentic Brain
 Defines all tools that JARVIS can use with function calling.
 """
 
+import functools
+import re
+
 # Tool schemas for Gemini function calling
 TOOL_DEFINITIONS = [
     {
@@ -143,7 +146,10 @@ DESTRUCTIVE_PATTERNS = [
     "git push --force", "git reset --hard",
 ]
 
+# All patterns in one alternation: a single C-level scan instead of one `in` per pattern
+_DESTRUCTIVE_RE = re.compile("|".join(map(re.escape, DESTRUCTIVE_PATTERNS)))
+
+@functools.lru_cache(maxsize=512)
 def is_destructive_command(command: str) -> bool:
     """Check if a command is potentially destructive."""
-    cmd_lower = command.lower()
-    return any(pattern in cmd_lower for pattern in DESTRUCTIVE_PATTERNS)
+    return _DESTRUCTIVE_RE.search(command.lower()) is not None
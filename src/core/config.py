@@ -5,7 +5,7 @@ Centralized settings using Pydantic for validation and type safety.
 
 from pathlib import Path
 from typing import Literal, Optional
-from pydantic import Field, field_validator
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -44,6 +44,11 @@ class Settings(BaseSettings):
         default="llama3.2",
         description="Ollama model to use"
     )
+    llm_response_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Reuse the raw reply for an identical prompt; number of replies kept (0 = off)"
+    )
     
     # ═══════════════════════════════════════════════════════════════
     # SPEECH-TO-TEXT (STT) CONFIGURATION
@@ -52,9 +57,25 @@ class Settings(BaseSettings):
         default="groq",
         description="STT provider: 'local' for faster-whisper, 'groq' for cloud"
     )
-    whisper_model_size: Literal["tiny", "base", "small", "medium", "large-v2", "large-v3"] = Field(
+    whisper_model_size: Literal[
+        "tiny", "base", "small", "medium", "large-v2", "large-v3",
+        "distil-small.en", "distil-medium.en", "distil-large-v3", "large-v3-turbo",
+    ] = Field(
         default="base",
-        description="Whisper model size for local STT"
+        description="Whisper model for local STT (distil-* share the Groq path's distilled decoder)"
+    )
+    whisper_compute_type: str = Field(
+        default="",
+        description="CTranslate2 compute type; empty = int8_float16 on CUDA, int8 on CPU ('auto' lets CTranslate2 pick)"
+    )
+    whisper_beam_size: int = Field(
+        default=1,
+        ge=1,
+        description="Whisper beam size (1 = greedy decoding, fastest on CPU)"
+    )
+    whisper_vad_filter: bool = Field(
+        default=True,
+        description="Skip silent regions inside Whisper using its built-in VAD"
     )
     
     # ═══════════════════════════════════════════════════════════════
@@ -68,6 +89,24 @@ class Settings(BaseSettings):
         default="+10%",
         description="TTS speech rate adjustment"
     )
+    tts_cache_size: int = Field(
+        default=64,
+        ge=0,
+        description="Synthesized phrases kept on disk for replay (0 disables)"
+    )
+    use_thinking_filler: bool = Field(
+        default=False,
+        description="Speak a short filler while the brain is slow to answer"
+    )
+    thinking_filler_text: str = Field(
+        default="One moment, Sheriff.",
+        description="Filler phrase spoken while waiting on the brain"
+    )
+    thinking_filler_delay: float = Field(
+        default=0.8,
+        ge=0.0,
+        description="Seconds to wait for the first reply sentence before speaking the filler"
+    )
     
     # ═══════════════════════════════════════════════════════════════
     # WAKE WORD CONFIGURATION
@@ -94,6 +133,21 @@ class Settings(BaseSettings):
         default="jarvis_memory",
         description="ChromaDB collection name"
     )
+    memory_batch_size: int = Field(
+        default=64,
+        ge=1,
+        description="Buffered memories that trigger an immediate batched write"
+    )
+    memory_flush_interval: float = Field(
+        default=2.0,
+        gt=0.0,
+        description="Seconds between background flushes of buffered memories"
+    )
+    memory_recall_cache_size: int = Field(
+        default=128,
+        ge=0,
+        description="Query embeddings kept in an LRU cache for recall (0 = off)"
+    )
     
     # ═══════════════════════════════════════════════════════════════
     # VISION CONFIGURATION
@@ -127,6 +181,11 @@ class Settings(BaseSettings):
         default=500,
         description="RMS threshold for silence detection"
     )
+    vad_rms_threshold: float = Field(
+        default=0.005,
+        ge=0.0,
+        description="RMS floor (float32 audio) below which STT is skipped entirely"
+    )
     silence_duration: float = Field(
         default=1.5,
         ge=0.5,
@@ -145,15 +204,6 @@ class Settings(BaseSettings):
         description="Log file path"
     )
     
-    # ═══════════════════════════════════════════════════════════════
-    # VALIDATORS
-    # ═══════════════════════════════════════════════════════════════
-    @field_validator("chroma_persist_path", "log_file", mode="before")
-    @classmethod
-    def ensure_path(cls, v: str | Path) -> Path:
-        """Convert string paths to Path objects."""
-        return Path(v) if isinstance(v, str) else v
-    
     # ═══════════════════════════════════════════════════════════════
     # COMPUTED PROPERTIES
     # ═══════════════════════════════════════════════════════════════
@@ -182,8 +232,10 @@ class Settings(BaseSettings):
     
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        self.chroma_persist_path.mkdir(parents=True, exist_ok=True)
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        for directory in (self.chroma_persist_path, self.log_file.parent):
+            # One stat when present; mkdir(exist_ok=True) costs a failed mkdir plus a stat
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
 
 
 # Singleton instance
@@ -3,33 +3,76 @@ JARVIS Logging System
 Rich console output with file logging for debugging.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import sys
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
 
-# ═══════════════════════════════════════════════════════════════
-# CUSTOM THEME FOR JARVIS
-# ═══════════════════════════════════════════════════════════════
-JARVIS_THEME = Theme({
-    "info": "cyan",
-    "warning": "yellow",
-    "error": "red bold",
-    "critical": "red bold reverse",
-    "success": "green bold",
-    "jarvis": "blue bold",
-    "user": "magenta",
-    "system": "dim white",
-})
+# Rich (and the pygments it pulls in) is only worth loading for an interactive
+# terminal. Headless runs (pythonw, services, redirected output) or
+# JARVIS_NO_RICH=1 get plain stdlib logging instead.
+_USE_RICH = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and os.environ.get("JARVIS_NO_RICH") != "1"
+)
+
+if _USE_RICH:
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from rich.theme import Theme
+
+    # ═══════════════════════════════════════════════════════════════
+    # CUSTOM THEME FOR JARVIS
+    # ═══════════════════════════════════════════════════════════════
+    JARVIS_THEME = Theme({
+        "info": "cyan",
+        "warning": "yellow",
+        "error": "red bold",
+        "critical": "red bold reverse",
+        "success": "green bold",
+        "jarvis": "blue bold",
+        "user": "magenta",
+        "system": "dim white",
+    })
+
+    # Global console instance
+    console = Console(theme=JARVIS_THEME)
+else:
+    class _PlainConsole:
+        """Minimal stand-in for rich.Console: prints with markup tags stripped."""
+
+        # Only JARVIS_THEME's style tags, so bracketed text such as "[1]" or
+        # "[user input]" in a message survives
+        _MARKUP_RE = re.compile(
+            r"\[(?:/?(?:info|warning|error|critical|success|jarvis|user|system)|/)\]"
+        )
+
+        def print(self, *objects, **_) -> None:
+            print(*(self._MARKUP_RE.sub("", str(obj)) for obj in objects))
+
+    # Global console instance
+    console = _PlainConsole()
+
+# Log file rotation caps
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Background thread that formats and writes records (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
 
-# Global console instance
-console = Console(theme=JARVIS_THEME)
 
-# Logger cache
-_loggers: dict[str, logging.Logger] = {}
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched so the console handler still gets exc_info for tracebacks."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 class JarvisFormatter(logging.Formatter):
@@ -63,6 +106,7 @@ def setup_logging(
         log_file: Path to log file. If None, uses default from settings.
         enable_file_logging: Whether to enable file logging.
     """
+    global _listener
     from .config import settings
     
     # Ensure log directory exists
@@ -77,29 +121,41 @@ def setup_logging(
     
     # Clear existing handlers
     root_logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    handlers: list[logging.Handler] = []
     
     # ─────────────────────────────────────────────────────────────
     # Console Handler (Rich)
     # ─────────────────────────────────────────────────────────────
-    console_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-        markup=True,
-    )
+    if _USE_RICH:
+        console_handler = RichHandler(
+            console=console,
+            show_time=True,
+            show_path=False,
+            rich_tracebacks=True,
+            tracebacks_show_locals=log_level <= logging.DEBUG,  # repr()s every frame local
+            markup=True,
+        )
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+    else:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter(
+            fmt="%(asctime)s %(levelname)-8s %(message)s",
+            datefmt="%H:%M:%S",
+        ))
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # ─────────────────────────────────────────────────────────────
     # File Handler
     # ─────────────────────────────────────────────────────────────
     if enable_file_logging and log_file:
-        file_handler = logging.FileHandler(
+        file_handler = logging.handlers.RotatingFileHandler(
             log_file,
-            mode="a",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
             encoding="utf-8",
         )
         file_handler.setLevel(logging.DEBUG)  # Always capture everything to file
@@ -108,7 +164,15 @@ def setup_logging(
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # ─────────────────────────────────────────────────────────────
+    # Queue: callers only enqueue; formatting and I/O run on the listener thread
+    # ─────────────────────────────────────────────────────────────
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Suppress noisy third-party loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -117,6 +181,14 @@ def setup_logging(
     logging.getLogger("chromadb").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records before the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name.
@@ -127,9 +199,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    if name not in _loggers:
-        _loggers[name] = logging.getLogger(name)
-    return _loggers[name]
+    return logging.getLogger(name)
 
 
 # ═══════════════════════════════════════════════════════════════
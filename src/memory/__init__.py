@@ -2,6 +2,13 @@
 Memory Module - Vector DB
 """
 
-from .hippocampus import d_hippocampus, Hippocampus
+
+def __getattr__(name: str):
+    # Deferred: importing hippocampus imports chromadb and opens the persistent store
+    if name in ("d_hippocampus", "Hippocampus"):
+        from . import hippocampus
+        return getattr(hippocampus, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["d_hippocampus", "Hippocampus"]
@@ -5,14 +5,29 @@ Handles long-term memory storage and retrieval using ChromaDB.
 
 import uuid
 import time
+import atexit
+import threading
 import chromadb
-from datetime import datetime
+from chromadb.utils import embedding_functions
+from collections import OrderedDict
 from typing import List, Optional
 from src.core.config import settings
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Local-time ISO 8601 timestamp (second precision) for memory metadata
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# HNSW build/search parameters. M and construction_ef are fixed when the index is
+# first built, so they only take effect for a newly created collection.
+COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 24,
+    "hnsw:construction_ef": 128,
+    "hnsw:search_ef": 64,
+}
+
 
 class Hippocampus:
     """
@@ -28,10 +43,14 @@ class Hippocampus:
             # Initialize persistent client
             self.client = chromadb.PersistentClient(path=self.persist_path)
             
+            # Chroma's default embedder, held directly so query embeddings can be cached
+            self._embed = embedding_functions.DefaultEmbeddingFunction()
+            
             # Get or create collection
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"hnsw:space": "cosine"}
+                metadata=COLLECTION_METADATA,
+                embedding_function=self._embed
             )
             logger.info(f"Hippocampus initialized at {self.persist_path}")
             
@@ -39,6 +58,22 @@ class Hippocampus:
             logger.error(f"Failed to initialize Memory: {e}")
             self.collection = None
 
+        # Write-behind buffer: one collection.add per batch instead of per turn
+        self._pending: list[tuple[str, str, dict]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # recall waits for an in-flight flush
+        self._stop_flusher = threading.Event()
+
+        # LRU cache of query embeddings keyed on the normalized query
+        # (settings.memory_recall_cache_size, 0 = off). Embeddings depend only on the
+        # query text, so unlike search results they never go stale on a write.
+        self._embedding_cache: "OrderedDict[str, list]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        if self.collection is not None:
+            threading.Thread(target=self._flush_loop, name="hippocampus-flush", daemon=True).start()
+            atexit.register(self.close)
+
     def memorize(self, text: str, source: str = "user") -> None:
         """
         Store a text memory with metadata.
@@ -50,23 +85,48 @@ class Hippocampus:
         if not self.collection or not text:
             return
 
-        try:
-            memory_id = str(uuid.uuid4())
-            timestamp = datetime.now().isoformat()
-            
-            self.collection.add(
-                documents=[text],
-                metadatas=[{
-                    "source": source,
-                    "timestamp": timestamp,
-                    "type": "conversation"
-                }],
-                ids=[memory_id]
-            )
-            logger.debug(f"Memorized ({source}): '{text[:30]}...'")
-            
-        except Exception as e:
-            logger.error(f"Failed to memorize: {e}")
+        memory_id = uuid.uuid4().hex
+        metadata = {
+            "source": source,
+            "timestamp": time.strftime(TIMESTAMP_FORMAT),
+            "type": "conversation"
+        }
+        with self._pending_lock:
+            self._pending.append((memory_id, text, metadata))
+            batch_full = len(self._pending) >= settings.memory_batch_size
+        logger.debug(f"Memorized ({source}): '{text[:30]}...'")
+
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered memories to the collection in a single add."""
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+
+            ids, documents, metadatas = zip(*batch)
+            try:
+                self.collection.add(
+                    documents=list(documents),
+                    metadatas=list(metadatas),
+                    ids=list(ids)
+                )
+                logger.debug(f"Flushed {len(batch)} memories")
+            except Exception as e:
+                logger.error(f"Failed to memorize: {e}")
+
+    def close(self) -> None:
+        """Stop the background flusher and write anything still buffered."""
+        self._stop_flusher.set()
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        """Background thread: flush the buffer every memory_flush_interval seconds."""
+        while not self._stop_flusher.wait(settings.memory_flush_interval):
+            self.flush()
 
     def recall(self, query: str, n_results: int = 3) -> str:
         """
@@ -82,15 +142,26 @@ class Hippocampus:
         if not self.collection or not query:
             return ""
 
+        # Read-your-writes: buffered memories must be searchable
+        self.flush()
+
         try:
+            # The default embedder lowercases its input, so a case-folded key is safe
+            key = query.strip().lower()
+            with self._cache_lock:
+                embedding = self._cache_get(self._embedding_cache, key)
+            if embedding is None:
+                embedding = self._embed([query])[0]
+                with self._cache_lock:
+                    self._cache_put(self._embedding_cache, key, embedding)
+
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[embedding],
                 n_results=n_results
             )
             
             documents = results['documents'][0] if results['documents'] else []
             metadatas = results['metadatas'][0] if results['metadatas'] else []
-            
             if not documents:
                 return ""
 
@@ -107,6 +178,22 @@ class Hippocampus:
             logger.error(f"Failed to recall: {e}")
             return ""
 
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value) -> None:
+        if not settings.memory_recall_cache_size:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > settings.memory_recall_cache_size:
+            cache.popitem(last=False)
+
 
 # Singleton instance
 d_hippocampus = Hippocampus()
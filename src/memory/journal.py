@@ -5,8 +5,11 @@ File: src/memory/journal.py
 """
 
 import os
+import atexit
 import datetime
+import threading
 from pathlib import Path
+from typing import Optional, TextIO
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,17 +17,56 @@ logger = get_logger(__name__)
 # Base directory for logs
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 
+# Today's journal stays open between entries; reopened when the date rolls over
+_handle: Optional[TextIO] = None
+_handle_path: Optional[Path] = None
+_handle_lock = threading.Lock()
+
+# Today's path is recomputed only when the date changes; the directory is checked once
+_today: Optional[datetime.date] = None
+_today_path: Optional[Path] = None
+_dir_checked = False
+
 def _ensure_log_dir():
     """Ensure the logs directory exists."""
+    global _dir_checked
+    if _dir_checked:
+        return
     if not LOG_DIR.exists():
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created log directory at {LOG_DIR}")
+    _dir_checked = True
 
 def get_today_file() -> Path:
     """Get the path to today's log file."""
-    _ensure_log_dir()
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    return LOG_DIR / f"{today}.md"
+    global _today, _today_path
+    today = datetime.date.today()
+    if today != _today:
+        _ensure_log_dir()
+        _today_path = LOG_DIR / f"{today:%Y-%m-%d}.md"
+        _today = today
+    return _today_path
+
+def _get_handle(log_file: Path) -> TextIO:
+    """Return the open append handle for log_file, swapping files on date rollover."""
+    global _handle, _handle_path
+    if _handle_path != log_file:
+        if _handle is not None:
+            _handle.close()
+        _handle = open(log_file, "a", encoding="utf-8")
+        _handle_path = log_file
+    return _handle
+
+def close() -> None:
+    """Close the journal file (called at exit)."""
+    global _handle, _handle_path
+    with _handle_lock:
+        if _handle is not None:
+            _handle.close()
+        _handle = None
+        _handle_path = None
+
+atexit.register(close)
 
 def log(category: str, message: str) -> str:
     """
@@ -39,16 +81,21 @@ def log(category: str, message: str) -> str:
         log_file = get_today_file()
         timestamp = datetime.datetime.now().strftime("%I:%M %p")
         
-        # Check if new file, add header
-        is_new = not log_file.exists()
+        # Format: - [Category] Message
+        entry = f"- [{category.upper()}] {message}\n"
         
-        with open(log_file, "a", encoding="utf-8") as f:
-            if is_new:
-                f.write(f"# Daily Log: {datetime.datetime.now().strftime('%Y-%m-%d')}\n\n")
-                f.write(f"## {timestamp} - Sheriff Online\n")
+        with _handle_lock:
+            f = _get_handle(log_file)
+            # Append mode positions at end of file, so offset 0 means a new file: add header
+            if f.tell() == 0:
+                entry = (
+                    f"# Daily Log: {datetime.datetime.now().strftime('%Y-%m-%d')}\n\n"
+                    f"## {timestamp} - Sheriff Online\n"
+                ) + entry
             
-            # Format: - [Category] Message
-            f.write(f"- [{category.upper()}] {message}\n")
+            # One write per entry; flushed so the journal survives a crash
+            f.write(entry)
+            f.flush()
             
         logger.info(f"Journaled: [{category}] {message}")
         return f"Logged to {log_file.name}."
@@ -24,16 +24,27 @@ def log_interaction(user_input: str, jarvis_response: str):
     except Exception as e:
         print(f"Memory Log Error: {e}")
 
+# Tail reads walk back from the end of the file in blocks, up to this many bytes
+TAIL_BLOCK_SIZE = 4096
+TAIL_MAX_BYTES = 64 * 1024
+
 def read_recent_context(limit: int = 5) -> str:
     """Reads the last N interactions from memory."""
     if not os.path.exists(MEMORY_FILE):
         return ""
         
     try:
-        with open(MEMORY_FILE, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            # Get last limit lines
-            recent = lines[-limit:]
-            return "".join(recent)
+        with open(MEMORY_FILE, "rb") as f:
+            # Read backwards until limit+1 newlines are buffered (the file ends with one)
+            pos = f.seek(0, os.SEEK_END)
+            tail = b""
+            while pos > 0 and tail.count(b"\n") <= limit and len(tail) < TAIL_MAX_BYTES:
+                step = min(TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+        # Get last limit lines (the partial line at the cut falls outside the slice)
+        recent = tail.splitlines(keepends=True)[-limit:]
+        return b"".join(recent).decode("utf-8", errors="replace")
     except Exception:
         return ""
@@ -4,6 +4,7 @@ Manages .sheriff ledger files for project context and task tracking.
 """
 
 import os
+import re
 from typing import Optional
 from src.core.logger import get_logger
 
@@ -17,10 +18,17 @@ PROJECT_PATHS = {
     "careerops": r"e:\Ai Agents\whoisalfaz.me\Web Projects\antigravity\Careerops"
 }
 
+# Alias (lowercase) -> (project root, .sheriff ledger path), joined once at import
+_RESOLVED = {
+    alias.lower(): (path, os.path.join(path, ".sheriff"))
+    for alias, path in PROJECT_PATHS.items()
+}
+
 # Global State for current project context
 current_project = {
     "alias": None,
-    "path": None
+    "path": None,
+    "sheriff_file": None
 }
 
 DEFAULT_TEMPLATE = """# PROJECT: {name}
@@ -37,24 +45,30 @@ DEFAULT_TEMPLATE = """# PROJECT: {name}
 - Notes: None
 """
 
+def _write_lines(sheriff_file: str, lines: list[str]) -> None:
+    """Replace the ledger atomically: write a sibling temp file, then swap it in."""
+    tmp_file = sheriff_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    os.replace(tmp_file, sheriff_file)
+
 def get_project_path(alias: str) -> Optional[str]:
     """Returns absolute path for project alias."""
-    return PROJECT_PATHS.get(alias.lower())
+    return _RESOLVED.get(alias.lower(), (None, None))[0]
 
 def load_project_context(alias: str) -> str:
     """
     Loads .sheriff file from project root.
     If missing, creates a default template.
     """
-    path = get_project_path(alias)
+    path, sheriff_file = _RESOLVED.get(alias.lower(), (None, None))
     if not path or not os.path.exists(path):
         return f"Project '{alias}' not found in registry."
 
     # Update global state
     current_project["alias"] = alias
     current_project["path"] = path
-    
-    sheriff_file = os.path.join(path, ".sheriff")
+    current_project["sheriff_file"] = sheriff_file
     
     if os.path.exists(sheriff_file):
         try:
@@ -82,7 +96,7 @@ def add_task(task: str) -> str:
     if not current_project["path"]:
         return "No project loaded. Use 'load_project_context' first."
         
-    sheriff_file = os.path.join(current_project["path"], ".sheriff")
+    sheriff_file = current_project["sheriff_file"]
     if not os.path.exists(sheriff_file):
         return "Internal Error: .sheriff file missing."
         
@@ -91,12 +105,14 @@ def add_task(task: str) -> str:
         with open(sheriff_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
             
-        # Find ## STATUS section
+        # Find ## STATUS and ## CONTEXT sections in one pass
         status_index = -1
+        has_context = False
         for i, line in enumerate(lines):
-            if "## STATUS" in line:
+            if status_index == -1 and "## STATUS" in line:
                 status_index = i
-                break
+            elif "## CONTEXT" in line:
+                has_context = True
         
         entry = f"- [ ] {task}\n"
         
@@ -109,12 +125,11 @@ def add_task(task: str) -> str:
             lines.append(entry)
             
         # Verify Context section exists, if not append it
-        if not any("## CONTEXT" in line for line in lines):
+        if not has_context:
              lines.append("\n## CONTEXT & BLOCKERS\n- Current issue: None\n")
              
         # Write back
-        with open(sheriff_file, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+        _write_lines(sheriff_file, lines)
             
         return f"Added task: {task}"
         
@@ -126,7 +141,7 @@ def log_blocker(issue: str) -> str:
     if not current_project["path"]:
         return "No project loaded."
         
-    sheriff_file = os.path.join(current_project["path"], ".sheriff")
+    sheriff_file = current_project["sheriff_file"]
     
     try:
         with open(sheriff_file, "r", encoding="utf-8") as f:
@@ -146,8 +161,7 @@ def log_blocker(issue: str) -> str:
             # Append if missing
             new_lines.append(f"- Current issue: {issue}\n")
 
-        with open(sheriff_file, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        _write_lines(sheriff_file, new_lines)
             
         return f"Logged blocker: {issue}"
         
@@ -160,23 +174,22 @@ def mark_complete(task_keyword: str) -> str:
         return "No project loaded."
         
     try:
-        sheriff_file = os.path.join(current_project["path"], ".sheriff")
+        sheriff_file = current_project["sheriff_file"]
         with open(sheriff_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            content = f.read()
             
-        updated_count = 0
-        new_lines = []
-        for line in lines:
-            if "- [ ]" in line and task_keyword.lower() in line.lower():
-                new_lines.append(line.replace("- [ ]", "- [x]"))
-                updated_count += 1
-            else:
-                new_lines.append(line)
+        # One regex pass finds every open-task line that mentions the keyword;
+        # only those lines reach Python, where their boxes get ticked
+        open_task_re = re.compile(
+            r"^(?=.*- \[ \])(?=.*" + re.escape(task_keyword) + r").*$",
+            re.IGNORECASE | re.MULTILINE
+        )
+        content, updated_count = open_task_re.subn(
+            lambda m: m.group().replace("- [ ]", "- [x]"), content
+        )
                 
-        with open(sheriff_file, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
-            
         if updated_count > 0:
+            _write_lines(sheriff_file, [content])
             return f"Marked {updated_count} task(s) as complete."
         else:
             return f"No task found matching '{task_keyword}'."
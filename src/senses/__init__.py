@@ -2,12 +2,21 @@
 Senses Module - Complete Audio Pipeline
 """
 
-from .audio import AudioInput
-from .stt import STTEngine
-from .tts import TTSEngine
+# Deferred: importing one sense (e.g. src.senses.vision) shouldn't load
+# faster-whisper, sounddevice and edge-tts. Names resolve to the module singletons.
+_EXPORTS = {
+    "d_mic": "audio", "AudioInput": "audio",
+    "d_stt": "stt", "STTEngine": "stt",
+    "d_tts": "tts", "TTSEngine": "tts",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        import importlib
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-d_mic = AudioInput()
-d_stt = STTEngine()
-d_tts = TTSEngine()
 
 __all__ = ["d_mic", "d_stt", "d_tts", "AudioInput", "STTEngine", "TTSEngine"]
@@ -4,14 +4,19 @@ Handles microphone stream, VAD (Voice Activity Detection), and audio capture.
 """
 
 import asyncio
+import collections
 import numpy as np
 import sounddevice as sd
 from typing import AsyncGenerator
 from src.core.config import settings
 from src.core.logger import get_logger
+from src.utils import dsp
 
 logger = get_logger(__name__)
 
+# The mic is captured as raw int16; thresholds below stay in float32 [-1, 1] units
+INT16_SCALE = 32768.0
+
 
 class AudioInput:
     """
@@ -20,13 +25,22 @@ class AudioInput:
 
     def __init__(self):
         self._running = False
-        self._queue = asyncio.Queue()
+        # PortAudio's thread appends raw blocks (deque append/popleft are thread-safe)
+        # and wakes the loop via call_soon_threadsafe; asyncio.Queue is loop-thread only
+        self._ring: collections.deque = collections.deque(maxlen=64)
+        self._ready = asyncio.Event()
+        self._loop = None
         self.sample_rate = settings.audio_sample_rate
         self.block_size = int(self.sample_rate * 0.03)  # 30ms block
         
         # VAD Parameters
         # Use config value (default 500) - see notes on float32 scaling
         self.vad_threshold = 0.01  # Adjusted for sensitivity
+        self.barge_in_threshold = 0.03  # Louder than VAD to ignore speaker bleed
+        # Hot loops compare int16 mean energy against squared, int16-scaled thresholds
+        # (no sqrt and no float conversion per block)
+        self._vad_threshold_sq = (self.vad_threshold * INT16_SCALE) ** 2
+        self._barge_in_threshold_sq = (self.barge_in_threshold * INT16_SCALE) ** 2
         self.silence_duration = settings.silence_duration
         self.channels = settings.audio_channels
         self.device_index = settings.input_device_index
@@ -43,85 +57,106 @@ class AudioInput:
                 # Fallback to 0 if all else fails, or let sounddevice decide
                 self.device_index = None
 
-        logger.info("Audio Input initialized (NumPy VAD)")
+        # Compile the RMS kernel now so the first block doesn't pay for it
+        dsp.warmup()
+        logger.info(f"Audio Input initialized ({'Numba' if dsp.HAS_NUMBA else 'NumPy'} VAD)")
 
     def _audio_callback(self, indata, frames, time, status):
         """Callback for sounddevice input stream."""
         if status:
             logger.warning(f"Audio input status: {status}")
         
-        # Put raw audio block into the async queue
+        # Hand the raw int16 bytes to the loop (half the size of float32)
         if self._running:
-            try:
-                self._queue.put_nowait(indata.copy())
-            except asyncio.QueueFull:
+            if len(self._ring) == self._ring.maxlen:
                 logger.warning("Audio input queue full, dropping frames")
+            self._ring.append(bytes(indata))
+            self._loop.call_soon_threadsafe(self._ready.set)
 
     async def listen(self) -> AsyncGenerator[np.ndarray, None]:
         """
-        Generator that yields audio blocks while listening.
+        Generator that yields flat int16 audio blocks while listening.
         Stops yielding after silence duration is met.
         """
-        self._running = True
         silence_start_time = None
         is_speaking = False
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._running = True
+        ring = self._ring
+        ready = self._ready
+        silence_duration = self.silence_duration
+        vad_threshold_sq = self._vad_threshold_sq
         
         # Configure input stream
-        stream = sd.InputStream(
+        stream = sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             blocksize=self.block_size,
             callback=self._audio_callback,
-            dtype="float32"  # Whisper prefers float32
+            dtype="int16"  # Native mic format; converted to float32 once per phrase
         )
 
         logger.debug("Starting audio stream...")
-        with stream:
-            while self._running:
-                try:
-                    # Get audio block from queue with timeout
-                    # Timeout ensures we can check if running flag changed
-                    audio_block = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    continue
-
-                # Calculate volume (RMS)
-                rms = np.sqrt(np.mean(audio_block**2))
-                
-                # Check for speech activity
-                if rms > self.vad_threshold:
-                    if not is_speaking:
-                        is_speaking = True
-                        logger.debug("Speech detected")
-                    silence_start_time = None
-                    yield audio_block
-                else:
-                    # Silence detected
-                    if is_speaking:
-                        if silence_start_time is None:
-                            silence_start_time = asyncio.get_event_loop().time()
-                        
-                        elapsed_silence = asyncio.get_event_loop().time() - silence_start_time
-                        
-                        if elapsed_silence > self.silence_duration:
-                            logger.debug(f"Silence timeout ({self.silence_duration}s). Stopping.")
-                            is_speaking = False
+        try:
+            with stream:
+                while True:
+                    # Wake exactly when a block arrives or stop() is called - no timeout polling
+                    while not ring and self._running:
+                        ready.clear()
+                        if ring:  # appended between the check and the clear
                             break
-                        
-                        # Yield silence to capture trailing audio if still within window
+                        await ready.wait()
+                    if not self._running:
+                        break  # stop() requested
+                    audio_block = np.frombuffer(ring.popleft(), dtype=np.int16)
+
+                    # Calculate volume (mean energy) over the interleaved samples
+                    energy = dsp.mean_square_i16(audio_block)
+                    
+                    # Check for speech activity (energy > threshold^2 <=> RMS > threshold)
+                    if energy > vad_threshold_sq:
+                        if not is_speaking:
+                            is_speaking = True
+                            logger.debug("Speech detected")
+                        silence_start_time = None
                         yield audio_block
                     else:
-                        # Initial silence, ignore or yield specifically for wake word?
-                        # For simple command loop, we can ignore initial noise floor calibration
-                        pass
-
-        self._running = False
+                        # Silence detected
+                        if is_speaking:
+                            now = loop.time()
+                            if silence_start_time is None:
+                                silence_start_time = now
+                            
+                            elapsed_silence = now - silence_start_time
+                            
+                            if elapsed_silence > silence_duration:
+                                logger.debug(f"Silence timeout ({silence_duration}s). Stopping.")
+                                is_speaking = False
+                                break
+                            
+                            # Yield silence to capture trailing audio if still within window
+                            yield audio_block
+                        else:
+                            # Initial silence, ignore or yield specifically for wake word?
+                            # For simple command loop, we can ignore initial noise floor calibration
+                            pass
+        finally:
+            self._running = False
         logger.debug("Audio stream stopped.")
 
+    @staticmethod
+    def _to_float(frames: list) -> np.ndarray:
+        """Join int16 blocks into one flat float32 array in [-1, 1] for Whisper."""
+        # One concatenation, one conversion to float32, scaled in place
+        audio_data = np.concatenate(frames).astype(np.float32)
+        audio_data *= 1.0 / INT16_SCALE
+        return audio_data
+
     async def record_phrase(self) -> np.ndarray:
         """
         Capture a single phrase of speech.
-        Returns the complete audio buffer as a numpy array.
+        Returns the complete audio buffer as a flat float32 array in [-1, 1].
         """
         frames = []
         async for block in self.listen():
@@ -130,23 +165,62 @@ class AudioInput:
         if not frames:
             return np.array([], dtype="float32")
             
-        # Concatenate and flatten to 1D array for Whisper (N, 1) -> (N,)
-        audio_data = np.concatenate(frames, axis=0)
-        return audio_data.flatten()
+        return self._to_float(frames)
+
+    async def listen_chunks(self, chunk_seconds: float = 2.0) -> AsyncGenerator[np.ndarray, None]:
+        """
+        Capture a single phrase, yielding it as flat float32 chunks of ~chunk_seconds
+        while the user is still speaking, so transcription can overlap capture.
+        Only the final chunk may be shorter than chunk_seconds.
+        """
+        chunk_samples = int(self.sample_rate * self.channels * chunk_seconds)
+        frames = []
+        pending_samples = 0
+        async for block in self.listen():
+            frames.append(block)
+            pending_samples += block.shape[0]
+            if pending_samples >= chunk_samples:
+                yield self._to_float(frames)
+                frames = []
+                pending_samples = 0
+        
+        if frames:
+            yield self._to_float(frames)
+
+    async def wait_for_barge_in(self) -> None:
+        """
+        Open the mic and return as soon as input energy crosses the barge-in threshold.
+        Event-driven: the audio thread computes RMS per block and wakes the loop,
+        so there is no polling while TTS plays.
+        """
+        loop = asyncio.get_running_loop()
+        triggered = asyncio.Event()
+        threshold_sq = self._barge_in_threshold_sq
+
+        def _callback(indata, frames, time, status):
+            if dsp.mean_square_i16(np.frombuffer(indata, dtype=np.int16)) > threshold_sq:
+                loop.call_soon_threadsafe(triggered.set)
+
+        with sd.RawInputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            blocksize=self.block_size,
+            device=self.device_index,
+            callback=_callback,
+            dtype="int16"
+        ):
+            await triggered.wait()
+        logger.debug("Barge-in detected")
 
     def stop(self):
         """Stop the audio input stream."""
         self._running = False
+        self._ready.set()
 
     def clear_queue(self):
         """Clear any stale audio from the queue (after interruption)."""
-        cleared = 0
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-                cleared += 1
-            except asyncio.QueueEmpty:
-                break
+        cleared = len(self._ring)
+        self._ring.clear()
         if cleared > 0:
             logger.debug(f"Cleared {cleared} stale audio chunks from queue")
 
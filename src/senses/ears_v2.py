@@ -4,32 +4,56 @@ Advanced audio input pipeline with Silero VAD and conversational latching.
 """
 
 import torch
+import functools
 import numpy as np
 import sounddevice as sd
 import time
 import asyncio
-from typing import Tuple, Optional
+from typing import AsyncGenerator, Tuple, Optional
 
 from src.core.config import settings
 from src.core.logger import get_logger, console
 
 logger = get_logger(__name__)
 
+try:
+    import onnxruntime  # noqa: F401 - lets silero-vad load its ONNX export
+    HAS_ONNX = True
+except ImportError:  # Optional dependency - fall back to the TorchScript model
+    HAS_ONNX = False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_silero() -> tuple:
+    """
+    Load Silero VAD once per process and return (model, utils).
+    ONNX Runtime session when available: lower per-call dispatch cost than
+    TorchScript; silero pins it to one intra-op thread.
+    """
+    model, utils = torch.hub.load(
+        repo_or_dir='snakers4/silero-vad',
+        model='silero_vad',
+        force_reload=False,
+        trust_repo=True,
+        onnx=HAS_ONNX
+    )
+    if not HAS_ONNX:
+        model.eval() # Set to evaluation mode (the ONNX wrapper has no train mode)
+    return model, utils
+
+
 class NaturalEars:
     def __init__(self):
         logger.info("Initializing NaturalEars (Silero VAD)...")
+        # Silero is a tiny per-chunk RNN: intra-op threads only add sync overhead
+        # and compete with the audio thread. Nothing else in JARVIS runs on torch.
+        torch.set_num_threads(1)
         try:
-            # Load Silero VAD
-            self.model, utils = torch.hub.load(
-                repo_or_dir='snakers4/silero-vad',
-                model='silero_vad',
-                force_reload=False,
-                trust_repo=True
-            )
+            # Load Silero VAD (shared: a second NaturalEars reuses the loaded model)
+            self.model, utils = _get_silero()
             (self.get_speech_timestamps, self.save_audio, self.read_audio, self.VADIterator, self.collect_chunks) = utils
-            self.model.eval() # Set to evaluation mode
             self.vad_iterator = self.VADIterator(self.model)
-            logger.info("Silero VAD loaded successfully.")
+            logger.info(f"Silero VAD loaded successfully ({'ONNX Runtime' if HAS_ONNX else 'TorchScript'}).")
         except Exception as e:
             logger.error(f"Failed to load Silero VAD: {e}")
             raise
@@ -66,8 +90,8 @@ class NaturalEars:
         Check if chunk contains speech using Silero.
         Expects float32 array [-1, 1].
         """
-        # Silero expects tensor
-        with torch.no_grad():
+        # Silero expects tensor; inference_mode also skips version-counter bookkeeping
+        with torch.inference_mode():
             tensor = torch.from_numpy(audio_chunk)
             speech_prob = self.model(tensor, self.sample_rate).item()
             
@@ -78,13 +102,15 @@ class NaturalEars:
         # TODO: Implement DeepFilterNet or simple bandpass
         return audio_chunk
 
-    async def listen(self) -> np.ndarray:
+    async def listen_stream(self, chunk_seconds: float = 0.5) -> AsyncGenerator[np.ndarray, None]:
         """
-        Listens for a complete phrase.
-        Returns float32 numpy array of audio.
-        Blocks until speech starts and ends.
+        Listens for a complete phrase, yielding ~chunk_seconds of audio at a time.
+        Yields float32 numpy arrays while the user is still speaking so that
+        transcription can overlap with capture. Ends when speech stops.
         """
-        buffer = []
+        pending = []
+        pending_samples = 0
+        chunk_samples = int(self.sample_rate * chunk_seconds)
         is_speaking = False
         silence_counter = 0
         silence_threshold = 20 # blocks (~0.6s)
@@ -103,45 +129,50 @@ class NaturalEars:
                         logger.warning("Audio buffer overflow")
                         
                     chunk = chunk.squeeze() # Remove channel dim
+                    speech_ended = False
                     
                     # Check VAD
                     if self.is_human_speech(chunk):
-                        if not is_speaking:
-                            # Speech started
-                            is_speaking = True
-                            buffer.append(chunk) # Include start
-                        else:
-                            buffer.append(chunk)
+                        # Speech started / continues (include start)
+                        is_speaking = True
+                        pending.append(chunk)
+                        pending_samples += len(chunk)
                         silence_counter = 0
                     else:
                         if is_speaking:
-                            buffer.append(chunk) # Include tail
+                            pending.append(chunk) # Include tail
+                            pending_samples += len(chunk)
                             silence_counter += 1
-                            if silence_counter > silence_threshold:
-                                # Speech ended
-                                break
+                            speech_ended = silence_counter > silence_threshold
                         else:
                             # Not speaking yet, just noise
                             pass
 
+                    # Hand off a chunk once enough audio has accumulated
+                    if pending and (speech_ended or pending_samples >= chunk_samples):
+                        yield self.clean_audio(np.concatenate(pending))
+                        pending = []
+                        pending_samples = 0
+
+                    if speech_ended:
+                        break
+
                     # Yield to event loop occasionally to keep UI responsive
                     await asyncio.sleep(0.01) 
-                    
-                    # Check Latch expiration periodically
-                    if self.check_latch():
-                        pass
 
         except Exception as e:
             logger.error(f"Error reading audio stream: {e}")
-            return np.array([], dtype=np.float32)
+
+    async def listen(self) -> np.ndarray:
+        """
+        Listens for a complete phrase.
+        Returns float32 numpy array of audio.
+        Blocks until speech starts and ends.
+        """
+        buffer = [chunk async for chunk in self.listen_stream()]
 
         # Combine buffer
         if not buffer:
              return np.array([], dtype=np.float32)
              
-        full_audio = np.concatenate(buffer)
-        
-        # Clean
-        full_audio = self.clean_audio(full_audio)
-        
-        return full_audio
+        return np.concatenate(buffer)
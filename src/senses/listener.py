@@ -4,12 +4,17 @@ Orchestrates the wake word detection and command listening.
 """
 
 import asyncio
+import re
 from src.core.config import settings
 from src.core.logger import get_logger, jarvis_speak, system_message
 from src.senses import d_mic, d_stt, d_tts
+from src.senses.tts import split_sentences
 
 logger = get_logger(__name__)
 
+# Actions always open with a JSON object (optionally fenced) per the tool contract
+ACTION_RE = re.compile(r"\s*(?:\{|```json)")
+
 
 class Listener:
     """
@@ -22,34 +27,38 @@ class Listener:
 
     def __init__(self):
         self.wake_word = settings.wake_word.lower()
+        # Whole-word, case-insensitive wake word; group 1 is whatever follows it
+        # (leading punctuation like "Jarvis, ..." is skipped)
+        self._wake_re = re.compile(
+            rf"\b{re.escape(self.wake_word)}\b\W*(.*)", re.IGNORECASE | re.DOTALL
+        )
 
     async def start(self):
         """Start the continuous listening loop."""
+        # Warm up STT in the background so the first phrase skips model load
+        self._warmup_task = asyncio.create_task(d_stt.warmup())
         jarvis_speak("Listening for wake word...")
         
         # Initial greeting
         # await d_tts.speak("Systems online. I am listening.")
         
+        # Hoisted out of the loop: minimum phrase length (0.5s) in samples
+        min_samples = int(settings.audio_sample_rate * 0.5)
+        wake_search = self._wake_re.search
+        
         while True:
             try:
                 # 1. Listen for audio (waits for Voice Activity)
-                # logger.debug("Waiting for voice...")
-                audio = await d_mic.record_phrase()
-                
-                # If audio is empty or too short, skip
-                if len(audio) < settings.audio_sample_rate * 0.5:  # < 0.5s
-                    continue
-
-                # 2. Transcribe
-                text = await d_stt.transcribe(audio)
+                # 2. Transcribe - overlapped with capture; phrases < 0.5s are skipped
+                text = await self.hear(min_samples)
                 if not text:
                     continue
                     
-                text_lower = text.lower()
                 logger.debug(f"Heard: '{text}'")
                 
                 # 3. Check for Wake Word
-                if self.wake_word in text_lower:
+                wake_match = wake_search(text)
+                if wake_match:
                     logger.info(f"Wake word detected: '{text}'")
                     
                     # Visual/Audio acknowledgement
@@ -58,16 +67,14 @@ class Listener:
                     
                     # Extract command if present in the same phrase
                     # e.g., "Jarvis turn on the lights"
-                    parts = text_lower.split(self.wake_word, 1)
-                    command = parts[1].strip() if len(parts) > 1 else ""
+                    command = wake_match.group(1).strip()
                     
                     # If no command immediately following, listen again for the command
                     if not command:
                         # Short timeout listen for follow-up
                         jarvis_speak("Awaiting command...")
                         # await d_tts.speak("Ready.")
-                        command_audio = await d_mic.record_phrase()
-                        command = await d_stt.transcribe(command_audio)
+                        command = await self.hear()
 
                     if command:
                         await self.process_command(command)
@@ -83,34 +90,96 @@ class Listener:
                 logger.error(f"Listener loop error: {e}", exc_info=True)
                 await asyncio.sleep(1)
 
+    async def hear(self, min_samples: int = 0) -> str:
+        """
+        Capture one phrase and return its transcript.
+        Chunks go to the STT stream while the user is still speaking, so only the
+        uncommitted tail is decoded after they stop. Phrases shorter than
+        min_samples are dropped without transcribing.
+        """
+        d_stt.start_stream()
+        fed = 0
+        async for chunk in d_mic.listen_chunks():
+            # Every chunk but the last is full-size, so a short first chunk is the whole phrase
+            if not fed and chunk.shape[0] < min_samples:
+                break
+            d_stt.feed(chunk)
+            fed += chunk.shape[0]
+        
+        if not fed:
+            return ""
+        return await d_stt.finish_stream()
+
     async def process_command(self, command: str):
         """Process a recognized command."""
         logger.info(f"Processing command: {command}")
-        jarvis_speak(f"Processing: {command}")
         
         # Send to Brain
         from src.brain import d_brain
         from src.tools import d_hands
+        from src.memory import d_hippocampus
         
-        response = await d_brain.think(command)
+        recalled = await asyncio.to_thread(d_hippocampus.recall, command)
+        
+        # Stream the reply: prose is spoken sentence by sentence as it arrives,
+        # legacy JSON actions are buffered for Hands
+        response = ""
+        pending = ""
+        interrupted = False
+        async for delta in d_brain.think_stream(command, recalled=recalled):
+            response += delta
+            if interrupted or ACTION_RE.match(response):
+                continue
+            pending += delta
+            ready, pending = split_sentences(pending)
+            for sentence in ready:
+                if await self.speak_with_interruption(sentence):
+                    interrupted = True
+                    break
         
         # Check if response is a JSON Action
-        clean_response = response.strip()
-        if clean_response.startswith("{") or clean_response.startswith("```json"):
+        if ACTION_RE.match(response):
             # Execute Action
-            jarvis_speak("Executing action...")
-            result_message = await d_hands.execute_action(clean_response)
+            logger.debug("Executing action...")
+            result_message = await d_hands.execute_action(response)
             
             # Speak Confirmation
-            jarvis_speak(f"Action: {result_message}")
-            await d_tts.speak(result_message)
+            jarvis_speak(result_message)
+            await self.speak_with_interruption(result_message)
             
             # Memorize the result as well?
             # d_brain.memory.memorize(f"System Action Result: {result_message}", "system")
         else:
             # Standard Text Response
-            jarvis_speak(f"Response: {response}")
-            await d_tts.speak(response)
+            jarvis_speak(response)
+            if not interrupted and pending.strip():
+                await self.speak_with_interruption(pending.strip())
+
+    async def speak_with_interruption(self, text: str) -> bool:
+        """
+        Speak text, cutting playback short if the user starts talking.
+        Returns True if the user interrupted.
+        """
+        speak_task = asyncio.create_task(d_tts.speak(text))
+        barge_in_task = asyncio.create_task(d_mic.wait_for_barge_in())
+        
+        done, pending = await asyncio.wait(
+            {speak_task, barge_in_task},
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        
+        interrupted = barge_in_task in done and not speak_task.done()
+        if interrupted:
+            logger.info("User interrupted speech (Barge-In)")
+            d_tts.stop()
+        
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Drop any audio captured while we were talking over each other
+        d_mic.clear_queue()
+        return interrupted
 
 
 # Singleton instance
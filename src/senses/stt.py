@@ -4,15 +4,30 @@ Handles transcription using faster-whisper.
 """
 
 import asyncio
+import concurrent.futures
 import numpy as np
 import os
+import struct
+import threading
+from typing import List, Optional, Tuple
 from faster_whisper import WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 from src.core.config import settings
 from src.core.logger import get_logger
 from src.utils.async_helpers import run_async
+from src.utils import dsp
 
 logger = get_logger(__name__)
 
+# Rolling buffer cap for streaming transcription (seconds of uncommitted audio)
+STREAM_MAX_SECONDS = 30.0
+
+# Canonical RIFF/WAVE header length for 16-bit PCM
+WAV_HEADER_SIZE = 44
+
+# Speech shorter than this after VAD is not worth a decoder pass (seconds)
+MIN_SPEECH_SECONDS = 0.3
+
 
 class STTEngine:
     """
@@ -22,54 +37,129 @@ class STTEngine:
     def __init__(self):
         self.model_size = settings.whisper_model_size
         self.device = "cuda" if os.environ.get("CUDA_VISIBLE_DEVICES") else "cpu"
-        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        # INT8 weights everywhere; fp16 activations on GPU
+        self.compute_type = settings.whisper_compute_type or (
+            "int8_float16" if self.device == "cuda" else "int8"
+        )
         self._model = None
+        self._model_lock = threading.Lock()
+        self._groq_client = None  # Created on first cloud transcription
+        self._vad_opts = VadOptions(
+            min_silence_duration_ms=1000, speech_pad_ms=400, max_speech_duration_s=30
+        )
+        # Every local model call runs on this one thread, so CTranslate2 keeps
+        # its per-thread state warm instead of hopping across the default pool
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper"
+        )
+        self.start_stream()
 
     def _load_model(self):
         """Lazy load the Whisper model."""
-        if self._model is None:
-            logger.info(f"Loading Whisper model ({self.model_size}) on {self.device}...")
-            # Use run_async to offload heavy loading if needed? No, must happen in executor
-            self._model = WhisperModel(
-                self.model_size, 
-                device=self.device, 
-                compute_type=self.compute_type
-            )
-            logger.info("Whisper model loaded.")
+        # Lock: warmup and the first transcription may race from executor threads
+        with self._model_lock:
+            if self._model is None:
+                logger.info(f"Loading Whisper model ({self.model_size}) on {self.device}...")
+                self._model = WhisperModel(
+                    self.model_size, 
+                    device=self.device, 
+                    compute_type=self.compute_type
+                )
+                # Report what CTranslate2 actually resolved (e.g. for "auto" or fallbacks)
+                resolved = getattr(self._model.model, "compute_type", self.compute_type)
+                logger.info(f"Whisper model loaded (compute_type={resolved}).")
         return self._model
 
-    async def transcribe(self, audio_data: np.ndarray) -> str:
+    async def warmup(self) -> None:
+        """
+        Load the model and run a dummy inference so the first real
+        utterance doesn't pay the cold-start cost.
+        """
+        if settings.stt_provider == "groq":
+            return
+
+        def _warm():
+            model = self._load_model()
+            # 1s of silence with VAD off so the decoder actually runs;
+            # consume the generator to force the pass
+            segments, _ = model.transcribe(
+                np.zeros(settings.audio_sample_rate, dtype=np.float32),
+                language="en", beam_size=1, vad_filter=False,
+            )
+            list(segments)
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, _warm)
+            logger.info("Whisper warmup complete.")
+        except Exception as e:
+            logger.warning(f"Whisper warmup failed: {e}")
+
+    async def transcribe(
+        self,
+        audio_data: np.ndarray,
+        beam_size: Optional[int] = None,
+        vad_filter: Optional[bool] = None,
+    ) -> str:
         """
         Transcribe audio data to text asynchronously.
         
         Args:
-            audio_data: Numpy array of audio samples (float32).
+            audio_data: Flat (N,) float32 numpy array of audio samples.
+            beam_size: Whisper beam size (defaults to settings, 1 = greedy).
+            vad_filter: Skip silence inside Whisper (defaults to settings).
             
         Returns:
             Transcribed text.
         """
-        if len(audio_data) == 0:
+        if audio_data.shape[0] == 0:
+            return ""
+
+        # Near-silence: skip the model (or API call) entirely
+        if dsp.rms_f32(audio_data) < settings.vad_rms_threshold:
+            logger.debug("Skipping STT: buffer below RMS floor")
             return ""
 
         if settings.stt_provider == "groq":
             return await self._transcribe_groq(audio_data)
 
+        if beam_size is None:
+            beam_size = settings.whisper_beam_size
+        if vad_filter is None:
+            vad_filter = settings.whisper_vad_filter
+
         # Run blocking model inference in a thread
         loop = asyncio.get_running_loop()
-        text = await loop.run_in_executor(None, self._run_transcription, audio_data)
+        text = await loop.run_in_executor(
+            self._executor, self._run_transcription, audio_data, beam_size, vad_filter
+        )
         return text.strip()
 
-    def _run_transcription(self, audio_data: np.ndarray) -> str:
+    def _run_transcription(
+        self, audio_data: np.ndarray, beam_size: int = 1, vad_filter: bool = True
+    ) -> str:
         """Blocking transcription function."""
         model = self._load_model()
+
+        # Run Silero VAD here rather than inside transcribe() so pure noise
+        # never reaches the decoder
+        if vad_filter:
+            chunks = get_speech_timestamps(audio_data, self._vad_opts)
+            speech = sum(c["end"] - c["start"] for c in chunks)
+            if speech < MIN_SPEECH_SECONDS * settings.audio_sample_rate:
+                logger.debug("Skipping STT: too little speech after VAD")
+                return ""
+            audio_data = np.concatenate([audio_data[c["start"]:c["end"]] for c in chunks])
         
         # English-only mode for better accuracy and speed
         segments, info = model.transcribe(
             audio_data,
             language="en",
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=1000, speech_pad_ms=400),
+            beam_size=beam_size,
+            best_of=1,
+            temperature=0.0,  # No temperature-fallback re-decodes
+            without_timestamps=True,  # Only the text is used here
+            vad_filter=False,  # Already applied above
             initial_prompt="Jarvis, service, sheriff, harvest.",  # Helps prime for wake words
             condition_on_previous_text=False,  # Prevents hallway-cates from previous audio
         )
@@ -85,48 +175,164 @@ class STTEngine:
         
         return text
 
+    # ═══════════════════════════════════════════════════════════════
+    # STREAMING (LocalAgreement-2)
+    # ═══════════════════════════════════════════════════════════════
+    def start_stream(self) -> None:
+        """Reset the rolling buffer for a new phrase."""
+        self._stream_chunks: List[np.ndarray] = []
+        self._stream_samples = 0
+        self._committed: List[str] = []
+        self._prev_words: List[str] = []
+        self._partial_task: Optional[asyncio.Task] = None
+
+    @property
+    def partial_text(self) -> str:
+        """Stabilized prefix of the phrase in progress."""
+        return " ".join(self._committed)
+
+    def feed(self, chunk: np.ndarray) -> None:
+        """
+        Append a chunk of the phrase in progress.
+        Schedules a background partial decode (local Whisper only) so
+        transcription overlaps with the user still speaking.
+        """
+        self._stream_chunks.append(chunk)
+        self._stream_samples += len(chunk)
+
+        # Cap the rolling buffer; drop the oldest uncommitted audio
+        max_samples = int(STREAM_MAX_SECONDS * settings.audio_sample_rate)
+        while self._stream_samples > max_samples and len(self._stream_chunks) > 1:
+            self._stream_samples -= len(self._stream_chunks.pop(0))
+            self._prev_words = []
+
+        # Cloud STT is billed per request; only transcribe the final phrase
+        if settings.stt_provider == "groq":
+            return
+
+        if self._partial_task is None or self._partial_task.done():
+            self._partial_task = asyncio.create_task(self._decode_partial())
+
+    async def finish_stream(self) -> str:
+        """
+        Finalize the phrase: decode the uncommitted tail and return the full text.
+        Resets the stream state.
+        """
+        if self._partial_task and not self._partial_task.done():
+            try:
+                await self._partial_task
+            except Exception as e:
+                logger.debug(f"Partial decode failed: {e}")
+
+        committed = self.partial_text
+        tail_audio = (
+            np.concatenate(self._stream_chunks)
+            if self._stream_chunks else np.array([], dtype=np.float32)
+        )
+        self.start_stream()
+
+        tail = await self.transcribe(tail_audio) if tail_audio.shape[0] else ""
+        return " ".join(part for part in (committed, tail) if part).strip()
+
+    async def _decode_partial(self) -> None:
+        """Decode the rolling buffer and commit words two hypotheses agree on."""
+        if not self._stream_chunks:
+            return
+
+        audio = np.concatenate(self._stream_chunks)
+        loop = asyncio.get_running_loop()
+        words = await loop.run_in_executor(
+            self._executor, self._run_word_transcription, audio, self.partial_text
+        )
+
+        # LocalAgreement-2: commit the longest common prefix with the last hypothesis
+        agreed = 0
+        for (word, _), prev in zip(words, self._prev_words):
+            if word.lower() != prev.lower():
+                break
+            agreed += 1
+
+        if agreed:
+            self._committed.extend(word for word, _ in words[:agreed])
+            self._trim_stream(int(words[agreed - 1][1] * settings.audio_sample_rate))
+        self._prev_words = [word for word, _ in words[agreed:]]
+
+    def _trim_stream(self, samples: int) -> None:
+        """Drop committed audio from the head of the rolling buffer."""
+        while samples > 0 and self._stream_chunks:
+            head = self._stream_chunks[0]
+            if len(head) <= samples:
+                self._stream_chunks.pop(0)
+                self._stream_samples -= len(head)
+                samples -= len(head)
+            else:
+                self._stream_chunks[0] = head[samples:]
+                self._stream_samples -= samples
+                samples = 0
+
+    def _run_word_transcription(
+        self, audio_data: np.ndarray, prompt: str = ""
+    ) -> List[Tuple[str, float]]:
+        """Blocking word-level transcription for partial hypotheses."""
+        model = self._load_model()
+
+        segments, _ = model.transcribe(
+            audio_data,
+            language="en",
+            beam_size=settings.whisper_beam_size,
+            vad_filter=settings.whisper_vad_filter,
+            word_timestamps=True,
+            initial_prompt=prompt or "Jarvis, service, sheriff, harvest.",
+            condition_on_previous_text=False,
+        )
+
+        return [
+            (word.word.strip(), word.end)
+            for segment in segments
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+
     async def _transcribe_groq(self, audio_data: np.ndarray) -> str:
         """Transcribe using Groq Cloud API (Distil-Whisper)."""
-        import io
-        import wave
-        
-        # Convert float32 -> int16
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-        
-        # Write to in-memory WAV
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2) # 16-bit
-            wf.setframerate(settings.audio_sample_rate)
-            wf.writeframes(audio_int16.tobytes())
-            
-        buffer.name = "audio.wav"
-        buffer.seek(0)
-        
-        loop = asyncio.get_running_loop()
+        if not settings.groq_api_key:
+            logger.error("Groq API Key missing for STT")
+            return ""
+
+        # Build the WAV in one buffer: 44-byte header, then float32 -> int16
+        # scaled straight into the payload (no intermediate arrays, no wave writer)
+        n_samples = audio_data.shape[0]
+        data_size = n_samples * 2  # 16-bit mono
+        wav = bytearray(WAV_HEADER_SIZE + data_size)
+        struct.pack_into(
+            "<4sI4s4sIHHIIHH4sI", wav, 0,
+            b"RIFF", WAV_HEADER_SIZE - 8 + data_size, b"WAVE",
+            b"fmt ", 16, 1, 1,  # PCM, mono
+            settings.audio_sample_rate, settings.audio_sample_rate * 2, 2, 16,
+            b"data", data_size,
+        )
+        pcm = np.frombuffer(wav, dtype=np.int16, count=n_samples, offset=WAV_HEADER_SIZE)
+        np.multiply(audio_data, 32767, out=pcm, casting="unsafe")
+        wav_bytes = bytes(wav)
         
-        def _call():
-            from groq import Groq
-            if not settings.groq_api_key:
-                logger.error("Groq API Key missing for STT")
-                return ""
-                
-            client = Groq(api_key=settings.groq_api_key)
-            
-            try:
-                transcription = client.audio.transcriptions.create(
-                    file=(buffer.name, buffer.read()),
-                    model="distil-whisper-large-v3-en",
-                    prompt="Jarvis, Sheriff, Service.", # Context hints
-                    response_format="json"
-                )
-                return transcription.text
-            except Exception as e:
-                logger.error(f"Groq STT Error: {e}")
-                return ""
+        # One async client for the process: keeps the TLS connection alive
+        # between utterances and needs no executor thread
+        if self._groq_client is None:
+            from groq import AsyncGroq
+            self._groq_client = AsyncGroq(api_key=settings.groq_api_key)
+
+        try:
+            transcription = await self._groq_client.audio.transcriptions.create(
+                file=("audio.wav", wav_bytes),
+                model="distil-whisper-large-v3-en",
+                prompt="Jarvis, Sheriff, Service.", # Context hints
+                response_format="json"
+            )
+            text = transcription.text
+        except Exception as e:
+            logger.error(f"Groq STT Error: {e}")
+            return ""
                 
-        text = await loop.run_in_executor(None, _call)
         if text:
             logger.info(f"Groq STT: '{text}'")
         return text.strip()
@@ -1,20 +1,32 @@
 """
 Text-to-Speech (TTS) Module with Interruption Support
-Uses edge-tts for synthesis and pygame for playback.
+Uses edge-tts for synthesis and mpv for playback.
 """
 
 import asyncio
-import time
-import os
-import pygame
+import hashlib
+import re
 import edge_tts
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
 from src.core.config import settings
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Console-less spawn on Windows (mpv is a console app); 0 elsewhere
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Sentence boundary for per-sentence TTS (terminal punctuation + whitespace)
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(buffer: str) -> tuple[list[str], str]:
+    """Split complete sentences off a streamed buffer. Returns (sentences, remainder)."""
+    parts = SENTENCE_END_RE.split(buffer)
+    return [part.strip() for part in parts[:-1] if part.strip()], parts[-1]
+
 
 class TTSEngine:
     """TTS Engine with interruption support."""
@@ -25,6 +37,14 @@ class TTSEngine:
         self.temp_dir = Path(".audio_cache")
         self.temp_dir.mkdir(exist_ok=True)
         
+        # Phrase cache: key -> MP3 path, least recently spoken first.
+        # Files from earlier runs are picked up oldest-first.
+        self._cache: "OrderedDict[str, Path]" = OrderedDict(
+            (path.stem, path)
+            for path in sorted(self.temp_dir.glob("tts_*.mp3"), key=lambda p: p.stat().st_mtime)
+        )
+        self._evict()
+        
         self._is_speaking = False
         self._process = None
         
@@ -35,22 +55,27 @@ class TTSEngine:
         return self._is_speaking
 
     def stop(self):
-        """Immediately silence audio using taskkill."""
-        if self._process:
+        """Immediately silence audio by terminating our own player."""
+        process = self._process
+        if process and process.returncode is None:
             try:
-                self._process.terminate()
-            except:
+                process.terminate()
+                # Escalate if mpv ignores the request (TerminateProcess on Windows is already final)
+                asyncio.get_running_loop().call_later(0.1, self._kill_if_running, process)
+                logger.debug("TTS Stopped (Barge-In sequence)")
+            except (ProcessLookupError, RuntimeError):
                 pass
-            self._process = None
-        
-        # Force kill any mpv instances
-        try:
-            os.system("taskkill /F /IM mpv.exe >nul 2>&1")
-        except:
-            pass
+        self._process = None
             
         self._is_speaking = False
-        logger.info("TTS Stopped (Barge-In sequence)")
+
+    @staticmethod
+    def _kill_if_running(process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
 
     async def speak(self, text: str) -> None:
         """Synthesize and speak text using MPV."""
@@ -63,39 +88,105 @@ class TTSEngine:
         self._is_speaking = True
         logger.info(f"TTS: '{text[:50]}...'")
         
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        process = None  # The player this call started
+        
         try:
-            # Generate unique filename
-            self._file_counter = getattr(self, "_file_counter", 0) + 1
-            output_file = self.temp_dir / f"speech_{self._file_counter}.mp3"
-            
-            # Clean up old file if exists
-            if output_file.exists():
-                try:
-                    output_file.unlink()
-                except Exception:
-                    pass
-
-            # Generate audio using edge-tts
-            communicate = edge_tts.Communicate(text, self.voice, rate=self.rate)
-            await communicate.save(str(output_file))
+            if cached is not None and cached.exists():
+                self._cache.move_to_end(key)
+                self._process = process = await asyncio.create_subprocess_exec(
+                    "mpv", "--no-terminal", "--volume=100", str(cached),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=_NO_WINDOW
+                )
+                await process.wait()
+                return
             
-            # Use MPV to play
-            # --no-terminal: quiet
-            self._process = subprocess.Popen(
-                ["mpv", "--no-terminal", "--volume=100", str(output_file)],
+            # Pipe edge-tts audio into mpv as it is synthesized, so playback
+            # starts with the first chunk instead of after the whole MP3
+            # --no-terminal: quiet; "-": read the stream from stdin
+            self._process = process = await asyncio.create_subprocess_exec(
+                "mpv", "--no-terminal", "--volume=100",
+                "--cache=yes", "--demuxer-cache-wait=no", "-",
+                stdin=subprocess.PIPE,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                creationflags=_NO_WINDOW
             )
             
-            # Wait for completion but allow interruption
-            while self._process and self._process.poll() is None:
-                await asyncio.sleep(0.1)
+            communicate = edge_tts.Communicate(text, self.voice, rate=self.rate)
+            audio = []
+            try:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        audio.append(chunk["data"])
+                        process.stdin.write(chunk["data"])
+                        await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                # stop() killed the player mid-stream
+                return
+            
+            # Only complete syntheses are cached
+            self._store(key, b"".join(audio))
+            
+            # Wake only when mpv exits; stop() terminating it ends the wait early
+            await process.wait()
             
         except Exception as e:
             logger.error(f"TTS error: {e}")
+            # Don't leave a player blocked on a half-written stdin
+            if process and process.returncode is None:
+                process.kill()
         finally:
-            self._is_speaking = False
-            self._process = None
+            # A newer speak() may own the player by now; leave its state alone
+            if self._process is process:
+                self._is_speaking = False
+                self._process = None
+
+    def _cache_key(self, text: str) -> str:
+        """Stable cache key for a phrase in the current voice and rate."""
+        digest = hashlib.blake2b(
+            f"{self.voice}\0{self.rate}\0{text.strip()}".encode(), digest_size=16
+        ).hexdigest()
+        return f"tts_{digest}"
+
+    def _store(self, key: str, audio: bytes) -> None:
+        """Write a synthesized phrase to the cache and evict the oldest."""
+        if settings.tts_cache_size <= 0 or not audio:
+            return
+        path = self.temp_dir / f"{key}.mp3"
+        try:
+            path.write_bytes(audio)
+        except OSError as e:
+            logger.debug(f"TTS cache write failed: {e}")
+            return
+        self._cache[key] = path
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently spoken phrases beyond the cache size."""
+        while len(self._cache) > settings.tts_cache_size:
+            _, path = self._cache.popitem(last=False)
+            path.unlink(missing_ok=True)
+
+    async def precache(self, phrases: list[str]) -> None:
+        """Synthesize stock phrases ahead of time so their first use is instant."""
+        for text in phrases:
+            key = self._cache_key(text)
+            if key in self._cache:
+                continue
+            try:
+                communicate = edge_tts.Communicate(text, self.voice, rate=self.rate)
+                audio = [
+                    chunk["data"] async for chunk in communicate.stream()
+                    if chunk["type"] == "audio"
+                ]
+                self._store(key, b"".join(audio))
+            except Exception as e:
+                logger.debug(f"TTS precache failed for '{text}': {e}")
 
     def _cleanup(self):
         pass # Minimal cleanup needed as we overwrite or use temp dir logic elsewhere
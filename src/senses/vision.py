@@ -3,18 +3,51 @@ Vision Module (The Eyes)
 Uses Ollama (moondream) to analyze screenshots.
 """
 
+import asyncio
 import io
 import base64
-import pyautogui
-from PIL import Image
+from PIL import ImageGrab
 import ollama
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 VISION_MODEL = "moondream"
+# Keep Moondream resident between calls instead of Ollama's 5 min default
+VISION_KEEP_ALIVE = "30m"
 
-def analyze_screen(prompt: str = "Describe what is on the screen.") -> str:
+# One client (and HTTP connection pool) for every vision call
+_client = ollama.AsyncClient(timeout=60)
+
+
+async def warmup() -> None:
+    """Load the vision model into Ollama so the first real call skips the cold load."""
+    try:
+        await _client.generate(model=VISION_MODEL, prompt="", keep_alive=VISION_KEEP_ALIVE)
+        logger.info(f"Vision model '{VISION_MODEL}' loaded.")
+    except Exception as e:
+        logger.warning(f"Vision warmup failed: {e}")
+
+
+def _capture_jpeg() -> bytes:
+    """Grab the primary screen and encode it as a downscaled JPEG (blocking)."""
+    # 1. Capture Screenshot (primary screen; what pyautogui.screenshot wraps)
+    screenshot = ImageGrab.grab(all_screens=False)
+    
+    # 2. Optimize image (max 1024x1024 for speed/context limit): a cheap
+    # integer box-reduce first, then thumbnail only resamples the small remainder
+    factor = max(screenshot.size) // 1024
+    if factor > 1:
+        screenshot = screenshot.reduce(factor)
+    screenshot.thumbnail((1024, 1024))
+    
+    # 3. Convert to bytes buffer (4:2:0 at q75 is plenty for the vision model)
+    img_buffer = io.BytesIO()
+    screenshot.save(img_buffer, format='JPEG', quality=75, subsampling=2)
+    return img_buffer.getvalue()
+
+
+async def analyze_screen(prompt: str = "Describe what is on the screen.") -> str:
     """
     Captures the screen and asks the vision model to analyze it.
     Args:
@@ -25,21 +58,14 @@ def analyze_screen(prompt: str = "Describe what is on the screen.") -> str:
     try:
         logger.info(f"Vision: capturing screen for prompt: '{prompt}'")
         
-        # 1. Capture Screenshot
-        screenshot = pyautogui.screenshot()
-        
-        # 2. Optimize image (Resize to max 1024x1024 for speed/context limit)
-        screenshot.thumbnail((1024, 1024))
-        
-        # 3. Convert to bytes buffer
-        img_buffer = io.BytesIO()
-        screenshot.save(img_buffer, format='JPEG', quality=85)
-        img_bytes = img_buffer.getvalue()
+        # Capture + encode off the event loop
+        img_bytes = await asyncio.to_thread(_capture_jpeg)
         
-        # 4. Query Ollama
+        # Query Ollama
         logger.info(f"Vision: sending to {VISION_MODEL}...")
-        response = ollama.chat(
+        response = await _client.chat(
             model=VISION_MODEL,
+            keep_alive=VISION_KEEP_ALIVE,
             messages=[{
                 'role': 'user',
                 'content': prompt,
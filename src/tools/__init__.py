@@ -2,6 +2,13 @@
 Tools Module - PC Automation
 """
 
-from .hands import d_hands, Hands
+
+def __getattr__(name: str):
+    # Deferred: most turns never touch Hands
+    if name in ("d_hands", "Hands"):
+        from . import hands
+        return getattr(hands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["d_hands", "Hands"]
@@ -1,18 +1,32 @@
 """
 Hands Module - Full System Control
-Uses PowerShell for reliable app launching.
+Launches apps through ShellExecute (os.startfile).
 """
 
 import os
+import sys
 import json
+import functools
 import webbrowser
-import pyautogui
-import subprocess
 from typing import Dict, Any
+from urllib.parse import quote_plus
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _gui():
+    """pyautogui, imported and configured on first keyboard/media action."""
+    import pyautogui
+    pyautogui.FAILSAFE = True
+    pyautogui.PAUSE = 0.1
+    return pyautogui
+
+# raw_decode parses the first JSON object and ignores whatever follows it
+# (closing ``` fences, trailing prose with stray braces)
+_DECODER = json.JSONDecoder()
+
 # Common apps - Use URI protocols for Windows Store apps
 COMMON_APPS = {
     # Browsers
@@ -37,6 +51,18 @@ COMMON_APPS = {
     "steam": "steam", "obs": "obs64",
 }
 
+# Spoken media key names -> pyautogui key names
+MEDIA_KEYS = {
+    "volumeup": "volumeup", "volumedown": "volumedown",
+    "mute": "volumemute", "volumemute": "volumemute",
+    "play": "playpause", "pause": "playpause", "playpause": "playpause",
+    "next": "nexttrack", "nexttrack": "nexttrack",
+    "prev": "prevtrack", "previous": "prevtrack",
+}
+VOLUME_KEYS = frozenset({"volumeup", "volumedown", "volumemute"})
+# Strips the separators from "volume up" / "next_track" in one pass
+_KEY_NORM = str.maketrans("", "", " _")
+
 # Windows Store apps use URI protocols
 URI_APPS = {
     "spotify": "spotify:",
@@ -53,30 +79,39 @@ URI_APPS = {
 
 
 class Hands:
-    """PC Automation using PowerShell for reliability."""
+    """PC Automation: apps, browser, media and keyboard."""
 
     def __init__(self):
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+        self._tool_dispatch = {
+            "browser": self._browser,
+            "media": self._media,
+            "system": self._system,
+            "app": self._app,
+            "keyboard": self._keyboard,
+        }
+        # Per-tool action tables (media and system have a single action each)
+        self._browser_actions = {
+            "open": self._browser_open,
+            "search": self._browser_search,
+        }
+        self._app_actions = {
+            "open": self._app_open, "launch": self._app_open, "start": self._app_open,
+            "close": self._app_close,
+        }
+        self._keyboard_actions = {
+            "type": self._keyboard_type,
+            "press": self._keyboard_press,
+            "hotkey": self._keyboard_hotkey,
+        }
         logger.info("Hands initialized")
 
     async def execute_action(self, json_string: str) -> str:
         """Parse and execute a JSON action."""
         try:
-            # Clean JSON
-            clean_json = json_string.strip()
-            if "```" in clean_json:
-                for part in clean_json.split("```"):
-                    if "{" in part and "}" in part:
-                        clean_json = part.replace("json", "").strip()
-                        break
-            
-            start = clean_json.find("{")
-            end = clean_json.rfind("}") + 1
-            if start != -1 and end > start:
-                clean_json = clean_json[start:end]
-            
-            command = json.loads(clean_json)
+            start = json_string.find("{")
+            if start == -1:
+                raise json.JSONDecodeError("No JSON object", json_string, 0)
+            command, _ = _DECODER.raw_decode(json_string, start)
             
             tool = command.get("tool", "").lower()
             action = command.get("action", "").lower()
@@ -84,18 +119,10 @@ class Hands:
             
             logger.info(f"Executing: {tool} -> {action} ({value})")
             
-            if tool == "browser":
-                return self._browser(action, value)
-            elif tool == "media":
-                return self._media(action, value)
-            elif tool == "system":
-                return self._system(action, value)
-            elif tool == "app":
-                return self._app(action, value)
-            elif tool == "keyboard":
-                return self._keyboard(action, value)
-            else:
+            handler = self._tool_dispatch.get(tool)
+            if handler is None:
                 return f"Unknown tool: {tool}"
+            return handler(action, value)
 
         except json.JSONDecodeError:
             logger.error(f"Invalid JSON: {json_string[:80]}")
@@ -106,31 +133,27 @@ class Hands:
 
     def _browser(self, action: str, value: str) -> str:
         """Browser actions."""
-        if action == "open":
-            if not value.startswith("http"):
-                value = f"https://{value}"
-            webbrowser.open(value)
-            return f"Opening {value.replace('https://', '').split('/')[0]}"
-        elif action == "search":
-            webbrowser.open(f"https://www.google.com/search?q={value.replace(' ', '+')}")
-            return f"Searching for {value}"
-        return "Browser action failed."
+        handler = self._browser_actions.get(action)
+        return handler(value) if handler else "Browser action failed."
+
+    def _browser_open(self, value: str) -> str:
+        if not value.startswith("http"):
+            value = f"https://{value}"
+        webbrowser.open(value)
+        return f"Opening {value.replace('https://', '').split('/')[0]}"
+
+    def _browser_search(self, value: str) -> str:
+        webbrowser.open(f"https://www.google.com/search?q={quote_plus(value)}")
+        return f"Searching for {value}"
 
     def _media(self, action: str, value: str) -> str:
         """Media control."""
         if action == "press":
-            key = value.lower().replace(" ", "").replace("_", "")
-            key_map = {
-                "volumeup": "volumeup", "volumedown": "volumedown",
-                "mute": "volumemute", "volumemute": "volumemute",
-                "play": "playpause", "pause": "playpause", "playpause": "playpause",
-                "next": "nexttrack", "nexttrack": "nexttrack",
-                "prev": "prevtrack", "previous": "prevtrack",
-            }
-            actual_key = key_map.get(key, key)
+            key = value.lower().translate(_KEY_NORM)
+            actual_key = MEDIA_KEYS.get(key, key)
             try:
-                pyautogui.press(actual_key)
-                return f"Volume adjusted." if "volume" in actual_key else "Media controlled."
+                _gui().press(actual_key)
+                return "Volume adjusted." if actual_key in VOLUME_KEYS else "Media controlled."
             except Exception:
                 return "Media control failed."
         return "Media action failed."
@@ -141,72 +164,77 @@ class Hands:
         
         # Only allow Jarvis to shut itself off
         if value_lower in ["exit", "quit", "shutdown", "goodbye", "stop", "bye"]:
-            import sys
             print("\n🤖 JARVIS: Goodbye, Sheriff.")
             sys.exit(0)
         
         # Block all other system commands for safety
         return "I cannot perform system control actions, Sheriff."
 
+    @staticmethod
+    def _launch(target: str) -> bool:
+        """
+        Open an exe name or URI via ShellExecute (os.startfile).
+        Resolves PATH and App Paths like Start-Process, without a PowerShell spawn;
+        a detached CreateProcess is the fallback for plain executables.
+        """
+        try:
+            os.startfile(target)
+            return True
+        except (OSError, AttributeError) as e:  # AttributeError: not on Windows
+            logger.debug(f"ShellExecute failed for '{target}': {e}")
+        if target.endswith(":"):  # URI protocols only work through ShellExecute
+            return False
+        import subprocess
+        flags = 0
+        if sys.platform == "win32":
+            flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        try:
+            subprocess.Popen([target], creationflags=flags, close_fds=True)
+            return True
+        except OSError as e:
+            logger.debug(f"Launch failed for '{target}': {e}")
+            return False
+
     def _app(self, action: str, value: str) -> str:
         """Launch apps - supports both regular apps and Windows Store apps."""
-        if action in ["open", "launch", "start"]:
-            app_name = value.lower().strip()
-            display_name = value.capitalize()
-            
-            # Method 1: Check URI protocols for Windows Store apps (Spotify, etc.)
-            if app_name in URI_APPS:
-                uri = URI_APPS[app_name]
-                try:
-                    cmd = f'powershell -Command "Start-Process \'{uri}\'"'
-                    subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    return f"Opening {display_name}."
-                except Exception as e:
-                    logger.error(f"URI launch failed: {e}")
-            
-            # Method 2: Check regular apps
-            if app_name in COMMON_APPS:
-                exe = COMMON_APPS[app_name]
-                try:
-                    cmd = f'powershell -Command "Start-Process \'{exe}\' -ErrorAction SilentlyContinue"'
-                    subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    return f"Opening {display_name}."
-                except Exception as e:
-                    logger.error(f"App launch failed: {e}")
-            
-            # Method 3: Try direct name
-            try:
-                cmd = f'powershell -Command "Start-Process \'{app_name}\' -ErrorAction SilentlyContinue"'
-                subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                return f"Opening {display_name}."
-            except Exception:
-                pass
-            
-            return f"Could not find {display_name}."
+        handler = self._app_actions.get(action)
+        return handler(value) if handler else "App action failed."
+
+    def _app_open(self, value: str) -> str:
+        app_name = value.lower().strip()
+        display_name = value.capitalize()
         
-        elif action == "close":
-            try:
-                exe_name = value.lower().replace(" ", "")
-                os.system(f"taskkill /IM {exe_name}.exe /F 2>nul")
-                return f"Closing {value}."
-            except Exception:
-                return f"Could not close {value}."
+        # URI protocol (Windows Store apps), then known exe, then the raw name
+        target = URI_APPS.get(app_name) or COMMON_APPS.get(app_name) or app_name
+        if self._launch(target) or (target != app_name and self._launch(app_name)):
+            return f"Opening {display_name}."
         
-        return "App action failed."
+        return f"Could not find {display_name}."
+
+    def _app_close(self, value: str) -> str:
+        from src.tools.system_ops import kill_by_name
+        exe_name = value.lower().replace(" ", "") + ".exe"
+        if kill_by_name({exe_name}):
+            return f"Closing {value}."
+        return f"Could not close {value}."
 
     def _keyboard(self, action: str, value: str) -> str:
         """Keyboard actions."""
-        if action == "type":
-            pyautogui.write(value)  # Use write() instead of typewrite()
-            return "Typed text."
-        elif action == "press":
-            pyautogui.press(value)
-            return f"Pressed {value}."
-        elif action == "hotkey":
-            keys = [k.strip() for k in value.split("+")]
-            pyautogui.hotkey(*keys)
-            return f"Pressed {value}."
-        return "Keyboard action failed."
+        handler = self._keyboard_actions.get(action)
+        return handler(value) if handler else "Keyboard action failed."
+
+    def _keyboard_type(self, value: str) -> str:
+        _gui().write(value)  # Use write() instead of typewrite()
+        return "Typed text."
+
+    def _keyboard_press(self, value: str) -> str:
+        _gui().press(value)
+        return f"Pressed {value}."
+
+    def _keyboard_hotkey(self, value: str) -> str:
+        keys = [k.strip() for k in value.split("+")]
+        _gui().hotkey(*keys)
+        return f"Pressed {value}."
 
 
 # Singleton
@@ -0,0 +1,82 @@
+"""
+Keyboard Input (The Fingers)
+Direct Win32 SendInput for single key presses; pyautogui is the fallback.
+"""
+
+import sys
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Virtual-key codes, keyed by pyautogui key names
+VK_CODES = {
+    "volumeup": 0xAF, "volumedown": 0xAE, "volumemute": 0xAD,
+    "playpause": 0xB3, "nexttrack": 0xB0, "prevtrack": 0xB1, "stop": 0xB2,
+    "enter": 0x0D, "return": 0x0D, "esc": 0x1B, "escape": 0x1B,
+    "tab": 0x09, "space": 0x20, "backspace": 0x08, "delete": 0x2E,
+    "up": 0x26, "down": 0x28, "left": 0x25, "right": 0x27,
+    "home": 0x24, "end": 0x23, "pageup": 0x21, "pagedown": 0x22,
+    **{f"f{i}": 0x6F + i for i in range(1, 13)},
+}
+
+_send_input = None
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG), ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD), ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD), ("dwExtraInfo", wintypes.WPARAM),
+        ]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD), ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+            ("dwExtraInfo", wintypes.WPARAM),
+        ]
+
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [
+            ("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        # Mouse member included so sizeof(INPUT) matches the Win32 definition
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+    _send_input = ctypes.windll.user32.SendInput
+    _send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _send_input.restype = wintypes.UINT
+
+
+def _send_vk(vk: int) -> bool:
+    """Key down + key up in a single SendInput call."""
+    events = (INPUT * 2)(
+        INPUT(type=INPUT_KEYBOARD, union=_INPUTUNION(ki=KEYBDINPUT(wVk=vk))),
+        INPUT(type=INPUT_KEYBOARD, union=_INPUTUNION(ki=KEYBDINPUT(wVk=vk, dwFlags=KEYEVENTF_KEYUP))),
+    )
+    return _send_input(2, events, ctypes.sizeof(INPUT)) == 2
+
+
+def press_key(key: str) -> None:
+    """
+    Press and release a key by its pyautogui name.
+    Known keys go straight to SendInput; anything else falls back to pyautogui.
+    """
+    vk = VK_CODES.get(key.lower())
+    if _send_input is not None and vk is not None:
+        if _send_vk(vk):
+            return
+        logger.debug(f"SendInput rejected '{key}', falling back to pyautogui")
+    import pyautogui
+    pyautogui.press(key)
@@ -1,48 +1,126 @@
 """
 Music Tool (The DJ)
 Uses yt-dlp and mpv to stream music without a browser.
+One mpv stays alive in idle mode; songs are swapped over its JSON IPC.
 """
 
+import asyncio
+import atexit
+import json
+import socket
 import subprocess
+import threading
 import os
-import signal
+import shutil
+import sys
+import tempfile
+from typing import Optional
 from src.core.logger import get_logger
+from src.tools.system_ops import kill_by_name
 
 logger = get_logger(__name__)
 
 # Track the current music process
 _music_process = None
+# Set by play_music, cleared by stop_music: lets the idle check skip IPC
+_playing = False
+# Upper bound on the idle-active query so a hung player can't stall the loop
+IPC_QUERY_TIMEOUT = 0.5
+# Upper bound on play/stop (IPC, or terminate + wait + name sweep), run off the loop
+MUSIC_OP_TIMEOUT = 5.0
+# Serializes play/stop worker threads around the shared player handle
+_player_lock = threading.Lock()
+# mpv plays the stream; yt-dlp is its resolver child
+MUSIC_PROCESSES = frozenset({"mpv.exe", "yt-dlp.exe"})
 
-def play_music(song_name: str) -> str:
+# mpv JSON IPC endpoint: a named pipe on Windows, a Unix socket elsewhere
+if sys.platform == "win32":
+    MPV_IPC_PATH = r"\\.\pipe\jarvis-mpv"
+else:
+    MPV_IPC_PATH = os.path.join(tempfile.gettempdir(), "jarvis-mpv.sock")
+
+# Environment for mpv, built once: .venv/Scripts on PATH so mpv finds yt-dlp
+_MUSIC_ENV = os.environ.copy()
+_venv_scripts = os.path.join(os.getcwd(), ".venv", "Scripts")
+if _venv_scripts not in _MUSIC_ENV.get("PATH", ""):
+    _MUSIC_ENV["PATH"] = _venv_scripts + os.pathsep + _MUSIC_ENV.get("PATH", "")
+# Console-less spawn on Windows (mpv is a console app); 0 elsewhere
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# Resolved once against that PATH so each spawn skips the search
+MPV_EXE = shutil.which("mpv", path=_MUSIC_ENV["PATH"]) or "mpv"
+
+def _ipc(*command) -> Optional[dict]:
+    """Send one command to the running mpv; returns its reply, or None if unreachable."""
+    request = json.dumps({"command": list(command), "request_id": 1}).encode() + b"\n"
+    try:
+        if sys.platform == "win32":
+            stream = open(MPV_IPC_PATH, "r+b")
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(1.0)
+            sock.connect(MPV_IPC_PATH)
+            stream = sock.makefile("rwb")
+            sock.close()  # The file object keeps the connection open
+        with stream:
+            stream.write(request)
+            stream.flush()
+            # Skip any event lines mpv interleaves before our reply
+            for line in stream:
+                reply = json.loads(line)
+                if reply.get("request_id") == 1:
+                    return reply
+    except (OSError, ValueError) as e:
+        logger.debug(f"mpv IPC failed: {e}")
+    return None
+
+def _player_alive() -> bool:
+    return _music_process is not None and _music_process.poll() is None
+
+async def play_music(song_name: str) -> str:
     """
     Streams music from YouTube using yt-dlp and mpv.
+    The blocking IPC/spawn runs in a worker thread, bounded by MUSIC_OP_TIMEOUT.
     Args:
         song_name: The name of the song/query to search.
     Returns:
         Status message.
     """
-    global _music_process
-    
-    # constant cleanup
-    stop_music()
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_play_music, song_name), timeout=MUSIC_OP_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.error("Music Error: player did not respond")
+        return "The music player isn't responding, Sheriff."
+
+def _play_music(song_name: str) -> str:
+    with _player_lock:
+        return _start_track(song_name)
+
+def _start_track(song_name: str) -> str:
+    """Swap the track on the idle player, or spawn a new one (caller holds _player_lock)."""
+    global _music_process, _playing
     
     logger.info(f"DJ: Searching for '{song_name}'...")
+    url = f"ytdl://ytsearch1:{song_name}"
     
-    # Command: mpv ytdl://ytsearch1:query --no-video
-    # Ensure yt-dlp is in PATH for mpv to find it
-    import sys
-    
-    # Add .venv/Scripts to PATH for this process
-    current_env = os.environ.copy()
-    venv_scripts = os.path.join(os.getcwd(), ".venv", "Scripts")
-    if venv_scripts not in current_env["PATH"]:
-        current_env["PATH"] = venv_scripts + os.pathsep + current_env["PATH"]
+    # Hot path: the idle player is already up, just swap the track
+    if _player_alive():
+        reply = _ipc("loadfile", url, "replace")
+        if reply and reply.get("error") == "success":
+            _playing = True
+            return f"Streaming '{song_name}' in the background, Sheriff."
+        # Unresponsive player: replace it
+        _stop_player()
     
+    # Command: mpv ytdl://ytsearch1:query --no-video (stays idle afterwards for IPC)
     mpv_cmd = [
-        "mpv",
-        f"ytdl://ytsearch1:{song_name}",
+        MPV_EXE,
+        url,
         "--no-video",
-        "--no-terminal"
+        "--no-terminal",
+        "--idle=yes",
+        f"--input-ipc-server={MPV_IPC_PATH}",
     ]
     
     try:
@@ -51,11 +129,10 @@ def play_music(song_name: str) -> str:
             mpv_cmd, 
             stdout=subprocess.DEVNULL, 
             stderr=subprocess.DEVNULL,
-            shell=False,
-            env=current_env
+            env=_MUSIC_ENV,
+            creationflags=_NO_WINDOW
         )
-        
-        return f"Streaming '{song_name}' in the background, Sheriff."
+        _playing = True
         
         return f"Streaming '{song_name}' in the background, Sheriff."
         
@@ -65,24 +142,68 @@ def play_music(song_name: str) -> str:
         logger.error(f"Music Error: {e}")
         return f"Failed to play music: {e}"
 
-def stop_music() -> str:
-    """Stops the currently playing music."""
+def _stop_player() -> bool:
+    """
+    Stop the tracked mpv, waiting on its process handle (WaitForSingleObject
+    on Windows) rather than spawning anything. Returns True if it was running.
+    """
     global _music_process
-    
-    # Use taskkill to be sure (windows specific)
+    process, _music_process = _music_process, None
+    if process is None or process.poll() is not None:
+        return False
+    process.terminate()
+    try:
+        process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    return True
+
+async def stop_music() -> str:
+    """Stops the currently playing music (off the loop, bounded by MUSIC_OP_TIMEOUT)."""
+    global _playing
+    _playing = False
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(_stop_music), timeout=MUSIC_OP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error("Music Error: player did not stop in time")
+        return "The music player isn't responding, Sheriff."
+
+def _stop_music() -> str:
     try:
-        subprocess.run(["taskkill", "/IM", "mpv.exe", "/F"], 
-                      stdout=subprocess.DEVNULL, 
-                      stderr=subprocess.DEVNULL,
-                      check=False)
-        _music_process = None
+        with _player_lock:
+            if _player_alive():
+                # Leave the player idle for the next song; kill it only if IPC is down
+                if not _ipc("stop"):
+                    _stop_player()
+            else:
+                # Sweep by name only when we hold no live handle (e.g. music left
+                # over from a previous run)
+                _stop_player()
+                kill_by_name(MUSIC_PROCESSES)
         return "Music stopped, Sheriff."
     except Exception as e:
         return f"Error stopping music: {e}"
 
-def is_music_playing() -> bool:
-    """Checks if music is currently playing."""
-    global _music_process
-    if _music_process and _music_process.poll() is None:
-        return True
-    return False
+async def is_music_playing() -> bool:
+    """
+    Checks if music is currently playing (an idle player doesn't count).
+    Local state answers without IPC unless a track was started; the query then
+    runs off the loop, and an unreachable or slow player counts as not playing.
+    """
+    global _playing
+    if not (_playing and _player_alive()):
+        return False
+    try:
+        reply = await asyncio.wait_for(
+            asyncio.to_thread(_ipc, "get_property", "idle-active"),
+            timeout=IPC_QUERY_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        return False
+    if not reply or reply.get("data") is not False:
+        # Track ended (or player unreachable): stop asking until the next song
+        _playing = False
+    return _playing
+
+# The idle player would otherwise outlive Jarvis
+atexit.register(_stop_player)
@@ -8,9 +8,54 @@ from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
-DISTRACTIONS = ["steam.exe", "discord.exe", "epicgameslauncher.exe", "spotify.exe"]
+DISTRACTIONS = frozenset({"steam.exe", "discord.exe", "epicgameslauncher.exe", "spotify.exe"})
 STARTUP_APPS = []  # Add apps to launch on focus exit if needed
 
+# Console-less spawn on Windows (no flashing PowerShell window); 0 elsewhere
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+def kill_by_name(names) -> int:
+    """
+    Kill every process whose image name (case-insensitive) is in names.
+    One pass over the process table; no taskkill spawn per name.
+    Returns the number of processes killed.
+    """
+    try:
+        import psutil
+    except ImportError:
+        # Without psutil: still a single taskkill, with one /IM per name. Its
+        # messages are localized, so count via tasklist's CSV image names instead
+        before = _count_by_name(names)
+        if not before:
+            return 0
+        args = ["taskkill", "/F"]
+        for name in names:
+            args += ["/IM", name]
+        subprocess.run(args, capture_output=True, creationflags=_NO_WINDOW)
+        return before - _count_by_name(names)
+
+    killed = 0
+    for proc in psutil.process_iter(["name"]):
+        if (proc.info["name"] or "").lower() in names:
+            try:
+                proc.kill()
+                killed += 1
+            except psutil.Error:
+                pass
+    return killed
+
+def _count_by_name(names) -> int:
+    """Number of running processes whose image name (case-insensitive) is in names (via tasklist)."""
+    result = subprocess.run(
+        ["tasklist", "/FO", "CSV", "/NH"],
+        capture_output=True, text=True, creationflags=_NO_WINDOW
+    )
+    # Each row is "image","pid",...; the image name column is never translated
+    return sum(
+        1 for line in result.stdout.splitlines()
+        if line.startswith('"') and line[1:].split('"', 1)[0].lower() in names
+    )
+
 def execute_powershell(script: str) -> str:
     """
     Executes a raw PowerShell script/command.
@@ -23,7 +68,8 @@ def execute_powershell(script: str) -> str:
             cmd, 
             capture_output=True, 
             text=True, 
-            timeout=30
+            timeout=30,
+            creationflags=_NO_WINDOW
         )
         
         if result.returncode == 0:
@@ -41,16 +87,7 @@ def toggle_focus_mode(state: bool) -> str:
     """
     if state:
         logger.info("Engaging Focus Mode...")
-        killed_count = 0
-        for app in DISTRACTIONS:
-            # taskkill /IM app /F
-            res = subprocess.run(
-                ["taskkill", "/IM", app, "/F"], 
-                stdout=subprocess.DEVNULL, 
-                stderr=subprocess.DEVNULL
-            )
-            if res.returncode == 0:
-                killed_count += 1
+        killed_count = kill_by_name(DISTRACTIONS)
                 
         return f"Focus Mode ON. Eliminated {killed_count} distractions."
     else:
@@ -4,15 +4,56 @@ Uses Microsoft UI Automation to interact with application windows reliably.
 File: src/tools/ui_ops.py
 """
 
+import time
 import uiautomation as auto
 import subprocess
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# How long a found window/button is reused before the UIA tree is searched again (seconds)
+UI_CACHE_TTL = 5.0
+
 class DesktopController:
     def __init__(self):
         auto.SetGlobalSearchTimeout(2)  # 2s timeout
+        # app_name -> (found_at, WindowControl); (app_name, button) -> (found_at, Control)
+        self._window_cache: dict = {}
+        self._control_cache: dict = {}
+
+    def _find_window(self, app_name: str):
+        """Main window for app_name, or None. Recent hits skip the UIA tree walk."""
+        now = time.monotonic()
+        cached = self._window_cache.get(app_name)
+        if cached and now - cached[0] < UI_CACHE_TTL:
+            window = cached[1]
+            # IsWindow on the handle is a cheap liveness check (no tree search)
+            if auto.IsWindow(window.NativeWindowHandle):
+                return window
+        self._window_cache.pop(app_name, None)
+
+        window = auto.WindowControl(searchDepth=1, Name=app_name, RegexName=True)
+        if not window.Exists(0):
+            return None
+        self._window_cache[app_name] = (now, window)
+        return window
+
+    def _find_control(self, window, app_name: str, button_name: str):
+        """Button (or any control) named button_name in window, or None."""
+        key = (app_name, button_name)
+        cached = self._control_cache.get(key)
+        if cached and time.monotonic() - cached[0] < UI_CACHE_TTL:
+            return cached[1]
+        self._control_cache.pop(key, None)
+
+        control = window.ButtonControl(Name=button_name)
+        if not control.Exists(0):
+            # Fallback: Generic Control
+            control = window.Control(Name=button_name)
+            if not control.Exists(0):
+                return None
+        self._control_cache[key] = (time.monotonic(), control)
+        return control
 
     def click_button_by_text(self, app_name: str, button_name: str) -> str:
         """
@@ -21,9 +62,9 @@ class DesktopController:
         logger.info(f"UI: Clicking '{button_name}' in '{app_name}'")
         
         # 1. Find Main Window
-        window = auto.WindowControl(searchDepth=1, Name=app_name, RegexName=True)
+        window = self._find_window(app_name)
         
-        if not window.Exists(0):
+        if window is None:
             return f"I can't find '{app_name}'. Is it open?"
 
         # 2. Focus
@@ -34,27 +75,32 @@ class DesktopController:
         except Exception as e:
             logger.warning(f"Could not focus window: {e}")
 
-        # 3. Find Button
-        btn = window.ButtonControl(Name=button_name)
+        # 3. Find Button (falls back to any control with that name)
+        control = self._find_control(window, app_name, button_name)
+        if control is None:
+            return f"Found {app_name}, but no button named '{button_name}'."
         
-        if btn.Exists(0):
-            btn.Click()
-            return f"Clicked '{button_name}' in {app_name}."
-        
-        # Fallback: Generic Control
-        item = window.Control(Name=button_name)
-        if item.Exists(0):
-            item.Click()
-            return f"Clicked '{button_name}' (Generic)."
-            
-        return f"Found {app_name}, but no button named '{button_name}'."
+        try:
+            control.Click()
+        except Exception:
+            # Stale element (UI changed since it was cached): drop it and look it up once more
+            self._control_cache.pop((app_name, button_name), None)
+            control = self._find_control(window, app_name, button_name)
+            if control is None:
+                return f"Found {app_name}, but no button named '{button_name}'."
+            try:
+                control.Click()
+            except Exception:
+                self._control_cache.pop((app_name, button_name), None)
+                raise
+        return f"Clicked '{button_name}' in {app_name}."
 
     def scan_app(self, app_name: str) -> str:
         """
         Scan an app window and list accessible elements.
         """
-        window = auto.WindowControl(searchDepth=1, Name=app_name, RegexName=True)
-        if not window.Exists(0):
+        window = self._find_window(app_name)
+        if window is None:
             return f"App '{app_name}' not found."
             
         elements = []
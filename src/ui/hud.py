@@ -6,28 +6,57 @@ PyQt6-based transparent overlay.
 import sys
 import math
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize, QPoint
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize, QPoint, QRect
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QBrush
 
 class ReactorWidget(QWidget):
+    # Only these states move; every other state is a static frame
+    ANIMATED_STATES = frozenset({"LISTENING", "PROCESSING"})
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(200, 200)
+        
+        # Fixed size, so geometry and colors are built once, not per frame
+        self._center = QPoint(self.width() // 2, self.height() // 2)
+        self._radius = 80
+        arc = self._radius + 10
+        self._arc_rect = QRect(self._center.x() - arc, self._center.y() - arc, arc * 2, arc * 2)
+        # state -> (ring color, core color)
+        self._palette = {
+            "IDLE": (QColor(0, 100, 255, 100), QColor(0, 200, 255, 150)),  # Dim Blue
+            "LISTENING": (QColor(0, 200, 255, 200), QColor(255, 255, 255, 200)),  # Bright Blue (+ Pulse)
+            "PROCESSING": (QColor(255, 140, 0, 200), QColor(255, 200, 50, 200)),  # Orange
+            "SPEAKING": (QColor(0, 255, 100, 200), QColor(100, 255, 150, 200)),  # Green
+        }
+        self._default_colors = (QColor(100, 100, 100, 100), QColor(50, 50, 50, 100))
+        self._ring_pen = QPen(self._palette["IDLE"][0], 4)
+        self._core_brush = QBrush(self._palette["IDLE"][1])
         self.state = "IDLE"
         self.angle = 0
         self.pulse = 0
         self.pulse_dir = 1
         
-        # Animation Timer
+        # Animation Timer (20 FPS, runs only while the state animates)
         self.timer = QTimer(self)
+        self.timer.setInterval(50)
         self.timer.timeout.connect(self.animate)
-        self.timer.start(50)  # 20 FPS
 
     def set_state(self, state: str):
+        if state == self.state:
+            return
         self.state = state
+        if state in self.ANIMATED_STATES:
+            self.timer.start()
+        else:
+            self.timer.stop()
+            self.angle = 0
+            self.pulse = 0
         self.update()
 
     def animate(self):
+        old = (self.angle, self.pulse)
+
         # Rotate logic
         if self.state == "PROCESSING":
             self.angle = (self.angle + 10) % 360
@@ -42,35 +71,26 @@ class ReactorWidget(QWidget):
         else:
             self.pulse = 0
             
-        self.update()
+        # Skip the repaint if nothing moved
+        if (self.angle, self.pulse) != old:
+            self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        center = QPoint(self.width() // 2, self.height() // 2)
-        radius = 80
+        center = self._center
+        radius = self._radius
         
         # Determine Color based on state
-        if self.state == "IDLE":
-            color = QColor(0, 100, 255, 100) # Dim Blue
-            core_color = QColor(0, 200, 255, 150)
-        elif self.state == "LISTENING":
-            color = QColor(0, 200, 255, 200 + self.pulse) # Bright Blue + Pulse
-            core_color = QColor(255, 255, 255, 200)
-        elif self.state == "PROCESSING":
-            color = QColor(255, 140, 0, 200) # Orange
-            core_color = QColor(255, 200, 50, 200)
-        elif self.state == "SPEAKING":
-            color = QColor(0, 255, 100, 200) # Green
-            core_color = QColor(100, 255, 150, 200)
-        else:
-            color = QColor(100, 100, 100, 100)
-            core_color = QColor(50, 50, 50, 100)
+        color, core_color = self._palette.get(self.state, self._default_colors)
+        if self.pulse:
+            color = QColor(color)
+            color.setAlpha(min(255, color.alpha() + self.pulse))
 
         # Draw Outer Ring
-        pen = QPen(color, 4)
-        painter.setPen(pen)
+        self._ring_pen.setColor(color)
+        painter.setPen(self._ring_pen)
         painter.drawEllipse(center, radius, radius)
         
         # Draw Rotating Segments (if processing)
@@ -78,14 +98,13 @@ class ReactorWidget(QWidget):
             painter.translate(center)
             painter.rotate(self.angle)
             painter.translate(-center)
-            painter.drawArc(center.x() - radius - 10, center.y() - radius - 10, 
-                           (radius + 10) * 2, (radius + 10) * 2, 0, 90 * 16)
-            painter.drawArc(center.x() - radius - 10, center.y() - radius - 10, 
-                           (radius + 10) * 2, (radius + 10) * 2, 180 * 16, 90 * 16)
+            painter.drawArc(self._arc_rect, 0, 90 * 16)
+            painter.drawArc(self._arc_rect, 180 * 16, 90 * 16)
             painter.resetTransform()
 
         # Draw Core
-        painter.setBrush(QBrush(core_color))
+        self._core_brush.setColor(core_color)
+        painter.setBrush(self._core_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         # Pulse effect on size
         core_radius = radius - 20 + (self.pulse / 5)
@@ -135,6 +154,7 @@ class JarvisHUD(QMainWindow):
         self.label.setWordWrap(True)
         self.label.setFixedWidth(280)
         layout.addWidget(self.label)
+        self._last_text = "Online"
         
         self.show()
 
@@ -142,6 +162,10 @@ class JarvisHUD(QMainWindow):
         self.reactor.set_state(state)
         
     def update_text(self, text: str):
+        # Steady states re-emit the same status; skip the QLabel relayout
+        if text == self._last_text:
+            return
+        self._last_text = text
         if len(text) > 100: text = text[:97] + "..."
         self.label.setText(text)
 
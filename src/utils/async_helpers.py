@@ -4,12 +4,18 @@ Helpers for managing async operations in JARVIS.
 """
 
 import asyncio
+import concurrent.futures
 from functools import wraps
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 from contextlib import asynccontextmanager
 
 T = TypeVar("T")
 
+# Shared workers for run_async calls made from inside a running loop
+_RUN_ASYNC_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="run_async"
+)
+
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """
@@ -28,11 +34,9 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
         loop = None
     
     if loop and loop.is_running():
-        # We're inside an async context, create a task
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
+        # We're inside an async context: blocking on our own loop would deadlock,
+        # so run the coroutine on a fresh loop in a pooled worker thread
+        return _RUN_ASYNC_POOL.submit(asyncio.run, coro).result()
     else:
         # No event loop running, safe to use asyncio.run
         return asyncio.run(coro)
@@ -65,35 +69,50 @@ def async_retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    budget: Optional[float] = None,
 ) -> Callable:
     """
     Decorator for retrying async functions with exponential backoff.
+    With a budget, retries stop at a deadline instead of after a fixed schedule.
     
     Args:
         max_retries: Maximum retry attempts
         delay: Initial delay between retries (seconds)
         backoff: Multiplier for delay after each retry
         exceptions: Tuple of exceptions to catch and retry
+        budget: Optional total time limit (seconds) across all attempts and
+            sleeps; attempts are cut off at the deadline and raise TimeoutError
         
     Returns:
         Decorated function
     """
+    # Sleep before each retry, computed once; None marks the final attempt
+    schedule = tuple(delay * backoff ** i for i in range(max_retries)) + (None,)
+    
     def decorator(func: Callable[..., Coroutine]) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            current_delay = delay
-            last_exception = None
+            if budget is None:
+                for retry_delay in schedule:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions:
+                        if retry_delay is None:
+                            raise
+                        await asyncio.sleep(retry_delay)
             
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-            
-            raise last_exception  # type: ignore
+            # One deadline for the whole call: each attempt races the time left
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + budget
+            async with asyncio.timeout_at(deadline):
+                for retry_delay in schedule:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions:
+                        # No point sleeping if the next attempt couldn't start in time
+                        if retry_delay is None or retry_delay >= deadline - loop.time():
+                            raise
+                        await asyncio.sleep(retry_delay)
         
         return wrapper
     return decorator
@@ -106,27 +125,30 @@ class AsyncEventBus:
     """
     
     def __init__(self) -> None:
-        self._listeners: dict[str, list[Callable]] = {}
+        # (callback, is_async) pairs in subscription order; the coroutine check is
+        # done once at subscribe time. Tuples are replaced (not mutated) on
+        # (un)subscribe, so an emit in progress keeps iterating a stable snapshot.
+        self._listeners: dict[str, tuple[tuple[Callable, bool], ...]] = {}
     
     def subscribe(self, event: str, callback: Callable) -> None:
         """Subscribe to an event."""
-        if event not in self._listeners:
-            self._listeners[event] = []
-        self._listeners[event].append(callback)
+        entry = (callback, asyncio.iscoroutinefunction(callback))
+        self._listeners[event] = self._listeners.get(event, ()) + (entry,)
     
     def unsubscribe(self, event: str, callback: Callable) -> None:
         """Unsubscribe from an event."""
         if event in self._listeners:
-            self._listeners[event].remove(callback)
+            listeners = list(self._listeners[event])
+            listeners.remove((callback, asyncio.iscoroutinefunction(callback)))
+            self._listeners[event] = tuple(listeners)
     
     async def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
-        """Emit an event to all subscribers."""
-        if event in self._listeners:
-            for callback in self._listeners[event]:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(*args, **kwargs)
-                else:
-                    callback(*args, **kwargs)
+        """Emit an event to all subscribers, in order (async ones awaited one at a time)."""
+        for callback, is_async in self._listeners.get(event, ()):
+            if is_async:
+                await callback(*args, **kwargs)
+            else:
+                callback(*args, **kwargs)
 
 
 # Global event bus instance
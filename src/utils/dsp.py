@@ -0,0 +1,66 @@
+"""
+Audio DSP Kernels
+Small numeric helpers on the audio hot path, JIT-compiled with Numba when available.
+"""
+
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Persist compiled kernels across runs (must be set before numba is imported)
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", str(Path(__file__).resolve().parents[2] / "data" / "numba_cache")
+)
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # Optional dependency - fall back to NumPy
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def rms_f32(x: np.ndarray) -> float:
+        """Root-mean-square of a 1D float32 block in a single fused loop."""
+        n = x.shape[0]
+        if n == 0:
+            return 0.0
+        s = 0.0
+        for i in range(n):
+            v = x[i]
+            s += v * v
+        return math.sqrt(s / n)
+
+    @njit(cache=True)
+    def mean_square_i16(x: np.ndarray) -> float:
+        """Mean energy of a 1D int16 block, accumulated in int64 (no float conversion)."""
+        n = x.shape[0]
+        if n == 0:
+            return 0.0
+        s = 0
+        for i in range(n):
+            v = np.int64(x[i])
+            s += v * v
+        return s / n
+else:
+    def rms_f32(x: np.ndarray) -> float:
+        """Root-mean-square of a 1D float32 block."""
+        if x.shape[0] == 0:
+            return 0.0
+        return float(np.sqrt(np.dot(x, x) / x.shape[0]))
+
+    def mean_square_i16(x: np.ndarray) -> float:
+        """Mean energy of a 1D int16 block."""
+        if x.shape[0] == 0:
+            return 0.0
+        x = x.astype(np.float32)  # int16 products would overflow
+        return float(np.dot(x, x)) / x.shape[0]
+
+
+def warmup() -> None:
+    """Trigger JIT compilation (or load the on-disk cache) ahead of the hot path."""
+    rms_f32(np.zeros(16, dtype=np.float32))
+    mean_square_i16(np.zeros(16, dtype=np.int16))